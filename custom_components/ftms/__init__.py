@@ -1,11 +1,14 @@
 """The FTMS integration."""
 
 import logging
+import time
+from collections.abc import Mapping
+from typing import Any
 
 import pyftms
+from bleak.backends.device import BLEDevice
 from bleak.exc import BleakError
 from homeassistant.components import bluetooth
-from homeassistant.components.bluetooth.match import BluetoothCallbackMatcher
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ADDRESS,
@@ -13,13 +16,35 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     Platform,
 )
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
-
-from .const import DOMAIN
+from homeassistant.helpers.typing import ConfigType
+
+from .analytics import DerivedMetrics, SummaryTracker
+from .connection import ConnectionManager
+from .const import (
+    CONF_AVERAGE_WINDOW,
+    CONF_DERIVED_SENSORS,
+    CONF_IDLE_TIMEOUT,
+    CONF_MAX_HEART_RATE,
+    CONF_MAX_UPDATE_RATE,
+    CONF_STATISTICS,
+    CONF_WEIGHT,
+    DEFAULT_AVERAGE_WINDOW,
+    DEFAULT_MAX_HEART_RATE,
+    DOMAIN,
+)
+from .control import CommandScheduler
 from .coordinator import DataCoordinator
 from .models import FtmsData
+from .program import ProgramRunner
+from .replay import TraceRecorder
+from .services import async_setup_services
+from .session import SessionBuffer
+from .statistics import StatisticsImporter
+from .storage import async_get_capabilities_store
 
 PLATFORMS: list[Platform] = [
     Platform.BUTTON,
@@ -30,9 +55,31 @@ PLATFORMS: list[Platform] = [
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 type FtmsConfigEntry = ConfigEntry[FtmsData]
 
 
+def _derived_options(options: Mapping[str, Any]) -> tuple[int, float] | None:
+    """Rolling window and weight of derived metrics. `None` if disabled."""
+
+    if not options.get(CONF_DERIVED_SENSORS, False):
+        return None
+
+    return (
+        int(options.get(CONF_AVERAGE_WINDOW, DEFAULT_AVERAGE_WINDOW)),
+        options.get(CONF_WEIGHT, 0),
+    )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the FTMS integration."""
+
+    async_setup_services(hass)
+
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: FtmsConfigEntry) -> bool:
     """Unload a config entry."""
 
@@ -43,91 +90,170 @@ async def async_unload_entry(hass: HomeAssistant, entry: FtmsConfigEntry) -> boo
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: FtmsConfigEntry) -> None:
+    """Remove stored capabilities of the machine."""
+
+    store = await async_get_capabilities_store(hass)
+    store.async_remove(entry.data[CONF_ADDRESS])
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: FtmsConfigEntry) -> bool:
     """Set up device from a config entry."""
 
     address: str = entry.data[CONF_ADDRESS]
+    start = time.monotonic()
 
-    if not (srv_info := bluetooth.async_last_service_info(hass, address)):
-        raise ConfigEntryNotReady(translation_key="device_not_found")
+    store = await async_get_capabilities_store(hass)
 
     def _on_disconnect(ftms_: pyftms.FitnessMachine) -> None:
-        """Disconnect handler. Reload entry on disconnect."""
+        """Disconnect handler. Reconnect in place, keeping entities alive."""
+
+        connection.async_on_disconnect()
+
+    # Sleeping machine is not advertising. Client of the stored machine type is
+    # created, and the device is set by the first advertisement.
+    if srv_info := bluetooth.async_last_service_info(hass, address):
+        device, adv_or_type = srv_info.device, srv_info.advertisement
 
-        if ftms_.need_connect:
-            hass.config_entries.async_schedule_reload(entry.entry_id)
+    elif (stored := store.get(address)) is not None:
+        device, adv_or_type = BLEDevice(address, None, None), stored.machine_type
+
+    else:
+        raise ConfigEntryNotReady(translation_key="device_not_found")
 
     try:
-        ftms = pyftms.get_client(
-            srv_info.device,
-            srv_info.advertisement,
-            on_disconnect=_on_disconnect,
-        )
+        ftms = pyftms.get_client(device, adv_or_type, on_disconnect=_on_disconnect)
 
     except pyftms.NotFitnessMachineError:
         raise ConfigEntryNotReady(translation_key="ftms_error")
 
     coordinator = DataCoordinator(hass, ftms)
+    coordinator.metrics.on_phase("discover", time.monotonic() - start)
+    connection = ConnectionManager(hass, entry, ftms, coordinator, store)
 
-    try:
-        await ftms.connect()
+    # Without stored capabilities, the machine must be connected to create entities.
+    if (caps := connection.capabilities) is None:
+        try:
+            await connection.async_connect()
 
-    except BleakError as exc:
-        raise ConfigEntryNotReady(translation_key="connection_failed") from exc
+        except BleakError as exc:
+            raise ConfigEntryNotReady(translation_key="connection_failed") from exc
 
-    assert ftms.machine_type.name
+        connection.async_on_connect()
+        caps = connection.capabilities
+        assert caps
 
-    _LOGGER.debug(f"Device Information: {ftms.device_info}")
-    _LOGGER.debug(f"Machine type: {ftms.machine_type.name}")
-    _LOGGER.debug(f"Available sensors: {ftms.available_properties}")
-    _LOGGER.debug(f"Supported settings: {ftms.supported_settings}")
-    _LOGGER.debug(f"Supported ranges: {ftms.supported_ranges}")
+    _LOGGER.debug("Device Information: %s", caps.device_info)
+    _LOGGER.debug("Machine type: %s", caps.machine_type.name)
+    _LOGGER.debug("Available sensors: %s", caps.available_properties)
+    _LOGGER.debug("Supported settings: %s", caps.supported_settings)
+    _LOGGER.debug("Supported ranges: %s", caps.supported_ranges)
 
     unique_id = "".join(
-        x for x in ftms.device_info.get("serial_number", address) if x.isalnum()
+        x for x in caps.device_info.get("serial_number", address) if x.isalnum()
     ).lower()
 
-    _LOGGER.debug(f"Registered new FTMS device. UniqueID is '{unique_id}'.")
+    _LOGGER.debug("Registered new FTMS device. UniqueID is '%s'.", unique_id)
+
+    assert caps.machine_type.name
 
     device_info = dr.DeviceInfo(
         connections={(dr.CONNECTION_BLUETOOTH, ftms.address)},
         identifiers={(DOMAIN, unique_id)},
-        translation_key=ftms.machine_type.name.lower(),
-        **ftms.device_info,
+        translation_key=caps.machine_type.name.lower(),
+        **caps.device_info,
     )
 
+    session = SessionBuffer(caps.available_properties)
+
+    summary = SummaryTracker(
+        hass,
+        coordinator,
+        session,
+        unique_id,
+        entry.options.get(CONF_MAX_HEART_RATE, DEFAULT_MAX_HEART_RATE),
+    )
+    entry.async_on_unload(
+        coordinator.async_add_event_listener(summary.async_on_event, live=True)
+    )
+
+    derived = None
+
+    if (derived_options := _derived_options(entry.options)) is not None:
+        derived = DerivedMetrics(
+            coordinator, caps.available_properties, *derived_options
+        )
+        entry.async_on_unload(
+            coordinator.async_add_event_listener(derived.async_on_event)
+        )
+
+    recorder = TraceRecorder(coordinator, ftms)
+    entry.async_on_unload(recorder.async_stop)
+
+    control = CommandScheduler(hass, entry, ftms, connection, coordinator.metrics)
+
+    program = ProgramRunner(hass, control, caps.supported_ranges)
+    entry.async_on_unload(program.async_stop)
+    entry.async_on_unload(
+        coordinator.async_add_event_listener(program.async_on_event, live=True)
+    )
+
+    statistics = None
+
+    if entry.options.get(CONF_STATISTICS, False):
+        if "recorder" in hass.config.components:
+            statistics = StatisticsImporter(hass, entry, ftms, unique_id)
+            statistics.async_start()
+            entry.async_on_unload(statistics.async_stop)
+            entry.async_on_unload(
+                coordinator.async_add_event_listener(
+                    statistics.async_on_event, live=True
+                )
+            )
+
+        else:
+            _LOGGER.warning("Recorder is not loaded. Statistics are not imported.")
+
     entry.runtime_data = FtmsData(
         entry_id=entry.entry_id,
         unique_id=unique_id,
         device_info=device_info,
         ftms=ftms,
+        capabilities=caps,
         coordinator=coordinator,
+        connection=connection,
+        session=session,
+        summary=summary,
+        derived=derived,
+        recorder=recorder,
+        control=control,
+        program=program,
+        statistics=statistics,
         sensors=entry.options[CONF_SENSORS],
+        max_update_rate=entry.options.get(CONF_MAX_UPDATE_RATE, 0),
     )
 
-    @callback
-    def _async_on_ble_event(
-        srv_info: bluetooth.BluetoothServiceInfoBleak,
-        change: bluetooth.BluetoothChange,
-    ) -> None:
-        """Update from a ble callback."""
-
-        ftms.set_ble_device_and_advertisement_data(
-            srv_info.device, srv_info.advertisement
-        )
+    connection.async_start_scanning()
+    entry.async_on_unload(connection.async_stop_scanning)
 
+    connection.async_set_idle_timeout(entry.options.get(CONF_IDLE_TIMEOUT, 0) * 60)
+    entry.async_on_unload(connection.async_cancel_idle)
     entry.async_on_unload(
-        bluetooth.async_register_callback(
-            hass,
-            _async_on_ble_event,
-            BluetoothCallbackMatcher(address=address),
-            bluetooth.BluetoothScanningMode.ACTIVE,
-        )
+        coordinator.async_add_event_listener(connection.async_on_event, live=True)
     )
 
+    # Connection switch may reset this latch while restoring its state.
+    ftms.need_connect = True
+
     # Platforms initialization
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Entities are created from stored capabilities. Connect in background.
+    if ftms.need_connect and not ftms.is_connected:
+        connection.async_reconnect()
+
+    coordinator.metrics.on_phase("setup", time.monotonic() - start)
+
     entry.async_on_unload(entry.add_update_listener(_async_entry_update_handler))
 
     async def _async_hass_stop_handler(event: Event) -> None:
@@ -147,5 +273,18 @@ async def _async_entry_update_handler(
 ) -> None:
     """Options update handler."""
 
-    if entry.options[CONF_SENSORS] != entry.runtime_data.sensors:
+    data = entry.runtime_data
+
+    # Applied without reload.
+    data.connection.async_set_idle_timeout(entry.options.get(CONF_IDLE_TIMEOUT, 0) * 60)
+
+    if (
+        entry.options[CONF_SENSORS] != data.sensors
+        or entry.options.get(CONF_MAX_UPDATE_RATE, 0) != data.max_update_rate
+        or entry.options.get(CONF_STATISTICS, False) != (data.statistics is not None)
+        or entry.options.get(CONF_MAX_HEART_RATE, DEFAULT_MAX_HEART_RATE)
+        != data.summary.max_heart_rate
+        or _derived_options(entry.options)
+        != ((x.window, x.weight) if (x := data.derived) else None)
+    ):
         hass.config_entries.async_schedule_reload(entry.entry_id)
@@ -0,0 +1,456 @@
+"""Workout analytics computed incrementally on the events stream."""
+
+import bisect
+import logging
+import math
+import time
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from pyftms import FtmsEvents, TrainingStatusCode
+from pyftms.client import const as c
+
+from .const import DOMAIN
+from .coordinator import DataCoordinator
+from .session import SessionBuffer
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_SESSION_SUMMARY = f"{DOMAIN}_session_summary"
+
+SESSION_SUMMARY = "session_summary"
+"""Key of the summary dispatched to the summary sensors."""
+SESSION_PREFIX = "session_"
+"""Prefix of the summary sensors keys."""
+
+DURATION = "duration"
+MOVING_TIME = "moving_time"
+POWER_AVERAGE = "power_average"
+POWER_MAX = "power_max"
+POWER_NORMALIZED = "power_normalized"
+CADENCE_AVERAGE = "cadence_average"
+SPEED_MAX = "speed_max"
+ENERGY_TOTAL = "energy_total"
+HEART_RATE_ZONES = tuple(f"heart_rate_zone_{i}" for i in range(1, 6))
+
+POWER_3S = "power_3s"
+POWER_30S = "power_30s"
+POWER_TO_WEIGHT = "power_to_weight"
+POWER_ROLLING = "power_rolling"
+SPEED_ROLLING = "speed_rolling"
+CADENCE_ROLLING = "cadence_rolling"
+
+_ROLLING = {
+    c.POWER_INSTANT: POWER_ROLLING,
+    c.SPEED_INSTANT: SPEED_ROLLING,
+    c.CADENCE_INSTANT: CADENCE_ROLLING,
+}
+"""Instant properties and keys of their rolling averages."""
+
+_HEART_RATE_ZONES = (0.6, 0.7, 0.8, 0.9)
+"""Upper bounds of the heart rate zones 1-4, fraction of the maximum heart rate."""
+_MAX_GAP = 5.0
+"""Longer gaps between samples are pauses and not accounted, seconds."""
+_NP_WINDOW = 30
+"""Rolling window of normalized power, seconds."""
+
+_FINISH_STATUSES = (TrainingStatusCode.IDLE, TrainingStatusCode.POST_WORKOUT)
+_RSSI = "rssi"
+
+
+class RollingWindow:
+    """
+    Time-weighted rolling average over a circular buffer of one second bins.
+
+    Value is held until the next sample. Each sample closes at most `_MAX_GAP`
+    bins, so it costs constant time. Longer gaps restart the current bin.
+    """
+
+    __slots__ = (
+        "_acc",
+        "_bins",
+        "_count",
+        "_pos",
+        "_second",
+        "_sum",
+        "_time",
+        "_value",
+    )
+
+    def __init__(self, seconds: int) -> None:
+        self._bins = [0.0] * seconds
+        self.clear()
+
+    @property
+    def full(self) -> bool:
+        return self._count == len(self._bins)
+
+    @property
+    def average(self) -> float | None:
+        """Average of the completed seconds in the window."""
+        return self._sum / self._count if self._count else None
+
+    def clear(self) -> None:
+        self._bins = [0.0] * len(self._bins)
+        self._count, self._pos, self._sum = 0, 0, 0.0
+        self._time: float | None = None
+        self._second, self._acc, self._value = 0, 0.0, 0.0
+
+    def _push(self, x: float) -> None:
+        """Add the average value of a completed second."""
+
+        bins, i = self._bins, self._pos
+        self._sum += x - bins[i]
+        bins[i] = x
+        self._pos = (i + 1) % len(bins)
+
+        if self._count < len(bins):
+            self._count += 1
+
+        # Drop accumulated rounding errors once per window pass.
+        if not self._pos:
+            self._sum = math.fsum(bins)
+
+    def add(self, timestamp: float, value: float) -> bool:
+        """Add the sample. Returns `True` if the window is moved."""
+
+        moved = False
+
+        if (t := self._time) is None or not 0 <= timestamp - t <= _MAX_GAP:
+            self._second = int(timestamp)
+            self._acc = value * (timestamp - self._second)
+
+        elif (second := int(timestamp)) == self._second:
+            self._acc += self._value * (timestamp - t)
+
+        else:
+            moved = True
+            held = self._value
+            self._push(self._acc + held * (self._second + 1 - t))
+
+            for _ in range(second - self._second - 1):
+                self._push(held)
+
+            self._second, self._acc = second, held * (timestamp - second)
+
+        self._time, self._value = timestamp, value
+
+        return moved
+
+
+class NormalizedPower(RollingWindow):
+    """Normalized power: 4th root of the mean 4th power of 30 s rolling average."""
+
+    __slots__ = ("_n4", "_sum4")
+
+    def __init__(self) -> None:
+        super().__init__(_NP_WINDOW)
+
+    @property
+    def value(self) -> float | None:
+        return (self._sum4 / self._n4) ** 0.25 if self._n4 else None
+
+    def clear(self) -> None:
+        super().clear()
+        self._sum4, self._n4 = 0.0, 0
+
+    def _push(self, x: float) -> None:
+        super()._push(x)
+
+        if self.full:
+            self._sum4 += (self._sum / self._count) ** 4
+            self._n4 += 1
+
+
+class SessionSummary:
+    """
+    Running totals of a workout session. Each sample costs constant time.
+
+    Session starts with the first movement. Values are held until the next
+    sample and accounted by the time they were held.
+    """
+
+    __slots__ = (
+        "_cadence",
+        "_cadence_sum",
+        "_duration",
+        "_energy",
+        "_energy_start",
+        "_heart_rate",
+        "_moving_time",
+        "_np",
+        "_power",
+        "_power_max",
+        "_power_sum",
+        "_speed",
+        "_speed_max",
+        "_time",
+        "_zones",
+        "_zones_bpm",
+        "active",
+    )
+
+    def __init__(self, max_heart_rate: int) -> None:
+        self._zones_bpm = [max_heart_rate * x for x in _HEART_RATE_ZONES]
+        self._np = NormalizedPower()
+        self.clear()
+
+    def clear(self) -> None:
+        self.active = False
+        self._time: float | None = None
+        self._duration = self._moving_time = 0.0
+        self._power = self._cadence = self._speed = self._heart_rate = 0.0
+        self._power_sum = self._cadence_sum = 0.0
+        self._power_max: float | None = None
+        self._speed_max: float | None = None
+        self._energy_start: float | None = None
+        self._energy: float | None = None
+        self._zones = [0.0] * len(HEART_RATE_ZONES)
+        self._np.clear()
+
+    @property
+    def _moving(self) -> bool:
+        return bool(self._speed or self._cadence or self._power)
+
+    def _account(self, dt: float) -> None:
+        """Account held values for the elapsed time."""
+
+        self._duration += dt
+
+        if self._moving:
+            self._moving_time += dt
+            self._power_sum += self._power * dt
+            self._cadence_sum += self._cadence * dt
+
+        if self._heart_rate:
+            self._zones[bisect.bisect(self._zones_bpm, self._heart_rate)] += dt
+
+    def add(self, timestamp: float, data: Mapping[str, Any]) -> None:
+        if self._time is not None and 0 < (dt := timestamp - self._time) <= _MAX_GAP:
+            self._account(dt)
+
+        if (x := data.get(c.POWER_INSTANT)) is not None:
+            self._power = x
+            self._power_max = x if self._power_max is None else max(self._power_max, x)
+
+        if (x := data.get(c.SPEED_INSTANT)) is not None:
+            self._speed = x
+            self._speed_max = x if self._speed_max is None else max(self._speed_max, x)
+
+        if (x := data.get(c.CADENCE_INSTANT)) is not None:
+            self._cadence = x
+
+        if (x := data.get(c.HEART_RATE)) is not None:
+            self._heart_rate = x
+
+        if not self.active:
+            if not self._moving:
+                return
+
+            self.active = True
+
+        if (x := data.get(c.ENERGY_TOTAL)) is not None:
+            if self._energy_start is None:
+                self._energy_start = x
+
+            self._energy = x
+
+        self._np.add(timestamp, self._power)
+        self._time = timestamp
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Summary values. `None` if the machine does not provide the data."""
+
+        moving = self._moving_time
+
+        if self._energy is not None and self._energy_start is not None:
+            energy = self._energy - self._energy_start
+
+        else:
+            # Gross efficiency of about 24% makes mechanical kJ close to burned kcal.
+            energy = self._power_sum / 1000 if self._power_max is not None else None
+
+        def avg(x: float, has_data: bool = True) -> float | None:
+            return round(x / moving, 1) if moving and has_data else None
+
+        np = self._np.value
+
+        return {
+            DURATION: round(self._duration),
+            MOVING_TIME: round(moving),
+            POWER_AVERAGE: avg(self._power_sum, self._power_max is not None),
+            POWER_MAX: self._power_max,
+            POWER_NORMALIZED: None if np is None else round(np, 1),
+            CADENCE_AVERAGE: avg(self._cadence_sum),
+            SPEED_MAX: self._speed_max,
+            ENERGY_TOTAL: None if energy is None else round(energy),
+        } | {k: round(v) for k, v in zip(HEART_RATE_ZONES, self._zones)}
+
+
+class SummaryTracker:
+    """
+    Feeds session summary by the events and publishes it on workout end.
+
+    Also starts and finishes the session of the samples buffer, so exported
+    session is the current or last workout.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: DataCoordinator,
+        session: SessionBuffer,
+        unique_id: str,
+        max_heart_rate: int,
+    ) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._session = session
+        self._unique_id = unique_id
+        self._status: TrainingStatusCode | None = None
+        self.max_heart_rate = max_heart_rate
+        self.summary = SessionSummary(max_heart_rate)
+
+    @callback
+    def async_on_event(self, e: FtmsEvents) -> None:
+        """Coordinator events listener."""
+
+        if e.event_id == "update":
+            self.summary.add(now := time.time(), data := e.event_data)
+            self._async_sample(now, data)
+
+            status = data.get(c.TRAINING_STATUS)
+
+            if status is not None and status != self._status:
+                self._status = status
+
+                if status in _FINISH_STATUSES:
+                    self.async_finish()
+
+        elif e.event_id == "stop":
+            self.async_finish()
+
+        elif e.event_id == "reset":
+            self.summary.clear()
+            self._session.clear()
+
+    @callback
+    def _async_sample(self, timestamp: float, data: Mapping[str, Any]) -> None:
+        """Append the sample to the buffer of the active session."""
+
+        session = self._session
+
+        if not self.summary.active:
+            # Values are held for the next session.
+            session.update(data)
+            return
+
+        # Advertisements update RSSI only.
+        if len(data) == 1 and _RSSI in data:
+            return
+
+        if not session.active:
+            session.start()
+
+        session.append(timestamp, data)
+
+    @callback
+    def async_finish(self) -> None:
+        """Publish the summary of the active session. Next movement starts new one."""
+
+        if not self.summary.active:
+            return
+
+        result = self.summary.as_dict()
+        self.summary.clear()
+        self._session.finish()
+
+        _LOGGER.debug("Session summary: %s", result)
+
+        self._coordinator.async_dispatch({SESSION_SUMMARY: result})
+
+        device = dr.async_get(self._hass).async_get_device(
+            identifiers={(DOMAIN, self._unique_id)}
+        )
+
+        self._hass.bus.async_fire(
+            EVENT_SESSION_SUMMARY, {"device_id": device and device.id} | result
+        )
+
+
+class DerivedMetrics:
+    """
+    Real-time metrics derived from the instant values.
+
+    All windows have one second resolution, so the values are dispatched to
+    the sensors once per second, not on every update.
+    """
+
+    def __init__(
+        self,
+        coordinator: DataCoordinator,
+        properties: Iterable[str],
+        window: int,
+        weight: float,
+    ) -> None:
+        self._coordinator = coordinator
+        self._values: dict[str, float] = dict.fromkeys(_ROLLING, 0.0)
+        self._rolling = {k: RollingWindow(window) for k in _ROLLING if k in properties}
+        self._power_3s = RollingWindow(3)
+        self._np = NormalizedPower()
+        self.window = window
+        self.weight = weight
+
+    def _clear(self) -> None:
+        for x in self._rolling.values():
+            x.clear()
+
+        self._power_3s.clear()
+        self._np.clear()
+
+    @callback
+    def async_on_event(self, e: FtmsEvents) -> None:
+        """Coordinator events listener."""
+
+        if e.event_id == "stop" or e.event_id == "reset":
+            self._clear()
+            self._coordinator.async_dispatch(self.as_dict(), unknown=True)
+            return
+
+        if e.event_id != "update":
+            return
+
+        data, values, now, moved = e.event_data, self._values, time.time(), False
+
+        for k, window in self._rolling.items():
+            if (x := data.get(k)) is not None:
+                values[k] = x
+
+            moved |= window.add(now, values[k])
+
+        if c.POWER_INSTANT in self._rolling:
+            self._power_3s.add(now, power := values[c.POWER_INSTANT])
+            self._np.add(now, power)
+
+        if moved:
+            self._coordinator.async_dispatch(self.as_dict())
+
+    def as_dict(self) -> dict[str, float | None]:
+        """Derived metrics. Keys depend only on capabilities and options."""
+
+        def value(x: float | None, digits: int = 1) -> float | None:
+            return None if x is None else round(x, digits)
+
+        result = {_ROLLING[k]: value(x.average) for k, x in self._rolling.items()}
+
+        if c.POWER_INSTANT in self._rolling:
+            result[POWER_3S] = value(p3s := self._power_3s.average)
+            result[POWER_30S] = value(self._np.average)
+            result[POWER_NORMALIZED] = value(self._np.value)
+
+            if self.weight:
+                result[POWER_TO_WEIGHT] = value(p3s and p3s / self.weight, 2)
+
+        return result
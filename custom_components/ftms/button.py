@@ -9,6 +9,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyftms.client import const as c
 
 from . import FtmsConfigEntry
+from .control import async_wait
 from .entity import FtmsEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,14 +46,8 @@ class FtmsButtonEntity(FtmsEntity, ButtonEntity):
     @override
     async def async_press(self) -> None:
         """Handle the button press."""
-        if self.key == c.RESET:
-            await self.ftms.reset()
 
-        elif self.key == c.START:
-            await self.ftms.start_resume()
+        await async_wait(self._data.control.async_command(self.key))
 
-        elif self.key == c.STOP:
-            await self.ftms.stop()
-
-        elif self.key == c.PAUSE:
-            await self.ftms.pause()
+        if self.key == c.STOP:
+            self._data.summary.async_finish()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Any
 
 import voluptuous as vol
@@ -11,10 +12,10 @@ from bluetooth_data_tools import human_readable_name
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
-    async_last_service_info,
 )
 from homeassistant.config_entries import (
     ConfigEntry,
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
@@ -30,10 +31,26 @@ from pyftms import (
     get_machine_type_from_service_data,
 )
 
-from .const import DOMAIN
+from .const import (
+    CONF_AVERAGE_WINDOW,
+    CONF_DERIVED_SENSORS,
+    CONF_IDLE_TIMEOUT,
+    CONF_MAX_HEART_RATE,
+    CONF_MAX_UPDATE_RATE,
+    CONF_STATISTICS,
+    CONF_WEIGHT,
+    DEFAULT_AVERAGE_WINDOW,
+    DEFAULT_MAX_HEART_RATE,
+    DISCOVERY_QUIET_PERIOD,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+)
+from .storage import Capabilities, async_get_capabilities_store
 
 _LOGGER = logging.getLogger(__name__)
 
+_DISCOVERY_POLL_INTERVAL = 0.5
+
 
 class OptionsFlowHandler(OptionsFlowWithConfigEntry):
     def __init__(self, config_entry: ConfigEntry) -> None:
@@ -47,12 +64,23 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        address = self.config_entry.data[CONF_ADDRESS]
+        entry, observed = self.config_entry, Counter[str]()
 
-        if not (srv_info := async_last_service_info(self.hass, address)):
-            return self.async_abort(reason="no_devices_found")
+        # Running entry knows capabilities and observed update frequencies.
+        if entry.state is ConfigEntryState.LOADED:
+            data = entry.runtime_data
+            caps, observed = data.capabilities, data.coordinator.metrics.properties
+
+        else:
+            store = await async_get_capabilities_store(self.hass)
+
+            if (caps := store.get(entry.data[CONF_ADDRESS])) is None:
+                return self.async_abort(reason="no_devices_found")
 
-        cli = get_client(srv_info.device, srv_info.advertisement)
+        # Live-observed properties first, most frequently updated on top.
+        properties = sorted(
+            caps.available_properties, key=lambda x: observed[x], reverse=True
+        )
 
         schema = vol.Schema(
             {
@@ -60,11 +88,71 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
                     {
                         "select": {
                             "multiple": True,
-                            "options": list(cli.available_properties),
+                            "options": properties,
                             "translation_key": CONF_SENSORS,
                         }
                     }
-                )
+                ),
+                vol.Required(CONF_MAX_UPDATE_RATE, default=0): selector(
+                    {
+                        "number": {
+                            "min": 0,
+                            "max": 10,
+                            "step": 0.5,
+                            "unit_of_measurement": "Hz",
+                            "mode": "box",
+                        }
+                    }
+                ),
+                vol.Required(
+                    CONF_MAX_HEART_RATE, default=DEFAULT_MAX_HEART_RATE
+                ): selector(
+                    {
+                        "number": {
+                            "min": 100,
+                            "max": 230,
+                            "unit_of_measurement": "bpm",
+                            "mode": "box",
+                        }
+                    }
+                ),
+                vol.Required(CONF_DERIVED_SENSORS, default=False): selector(
+                    {"boolean": {}}
+                ),
+                vol.Required(
+                    CONF_AVERAGE_WINDOW, default=DEFAULT_AVERAGE_WINDOW
+                ): selector(
+                    {
+                        "number": {
+                            "min": 5,
+                            "max": 3600,
+                            "unit_of_measurement": "s",
+                            "mode": "box",
+                        }
+                    }
+                ),
+                vol.Required(CONF_WEIGHT, default=0): selector(
+                    {
+                        "number": {
+                            "min": 0,
+                            "max": 250,
+                            "step": 0.1,
+                            "unit_of_measurement": "kg",
+                            "mode": "box",
+                        }
+                    }
+                ),
+                vol.Required(CONF_STATISTICS, default=False): selector({"boolean": {}}),
+                vol.Required(CONF_IDLE_TIMEOUT, default=0): selector(
+                    {
+                        "number": {
+                            "min": 0,
+                            "max": 240,
+                            "unit_of_measurement": "min",
+                            "mode": "box",
+                        }
+                    }
+                ),
             }
         )
 
@@ -82,6 +170,9 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
     _ble_info: BluetoothServiceInfoBleak
     _discovered_devices: dict[str, BluetoothServiceInfoBleak]
     _discovery_time: float
+    _discovery_done: bool = False
+    _discovery_start: float
+    _discovery_change: float
     _suggested_sensors: list[str]
 
     _ftms: FitnessMachine | None = None
@@ -162,7 +253,9 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
         """Choosing properties discovering method"""
 
         if user_input is not None:
-            self._discovery_time = 30 if user_input[CONF_DISCOVERY] == "auto" else 0
+            self._discovery_time = (
+                DISCOVERY_TIMEOUT if user_input[CONF_DISCOVERY] == "auto" else 0
+            )
             return await self.async_step_ble_request()
 
         # here we know device
@@ -214,7 +307,11 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if not uncompleted_task and self._discovery_time:
             if not self._task2:
-                coro = asyncio.sleep(self._discovery_time)
+                self._discovery_start = self._discovery_change = self.hass.loop.time()
+
+            # Each new found property completes the task to update the progress.
+            if not self._task2 or (self._task2.done() and not self._discovery_done):
+                coro = self._async_discover(len(ftms.live_properties))
                 self._task2 = self.hass.async_create_task(coro)
 
             if not self._task2.done():
@@ -233,6 +330,7 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
                 step_id="ble_request",
                 progress_action=action,
                 progress_task=uncompleted_task,
+                description_placeholders={"found": str(len(ftms.live_properties))},
             )
 
         self._suggested_sensors = list(
@@ -248,6 +346,30 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_progress_done(next_step_id="information")
 
+    async def _async_discover(self, found: int) -> None:
+        """
+        Waits for a new live property. Discovery is done when the set of live
+        properties is stable for the quiet period or on timeout.
+        """
+
+        assert self._ftms
+        loop = self.hass.loop
+
+        while (now := loop.time()) - self._discovery_start < self._discovery_time:
+            if len(self._ftms.live_properties) != found:
+                self._discovery_change = now
+                return
+
+            if found and now - self._discovery_change >= DISCOVERY_QUIET_PERIOD:
+                break
+
+            self.async_update_progress(
+                (now - self._discovery_start) / self._discovery_time
+            )
+            await asyncio.sleep(_DISCOVERY_POLL_INTERVAL)
+
+        self._discovery_done = True
+
     async def async_step_information(self, user_input=None):
         assert self._ftms
 
@@ -255,9 +377,13 @@ class FTMSConfigFlow(ConfigFlow, domain=DOMAIN):
             unique_id = self._ftms.address
             await self.async_set_unique_id(unique_id, raise_on_progress=False)
 
+            # Entry setup will not wait for the connection.
+            store = await async_get_capabilities_store(self.hass)
+            store.async_save(unique_id, Capabilities.from_client(self._ftms))
+
             s1 = self._ftms.device_info.get("manufacturer", "FTMS")
             s2 = self._ftms.device_info.get("model", "GENERIC")
-            s3 = f"({self._ftms.device_info.get("serial_number", unique_id)})"
+            s3 = f"({self._ftms.device_info.get('serial_number', unique_id)})"
 
             return self.async_create_entry(
                 title=" ".join((s1, s2, s3)),
@@ -0,0 +1,367 @@
+"""Connection manager of the FTMS integration."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any
+
+from bleak.exc import BleakError
+from bleak.uuids import normalize_uuid_str
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth.match import BluetoothCallbackMatcher
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from pyftms import (
+    FitnessMachine,
+    FtmsEvents,
+    NotFitnessMachineError,
+    TrainingStatusCode,
+    get_machine_type_from_service_data,
+)
+from pyftms.client import const as c
+
+from .coordinator import DataCoordinator
+from .placement import async_get_placement
+from .storage import Capabilities, CapabilitiesStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_BACKOFF_MIN = 1.0
+"""Upper bound of the first reconnection delay, seconds."""
+_BACKOFF_MAX = 120.0
+"""Maximum reconnection delay, seconds."""
+_IDLE_PROPERTIES = (c.TRAINING_STATUS, c.SPEED_INSTANT, c.CADENCE_INSTANT)
+"""Properties defining the idle state of the machine."""
+_FTMS_SERVICE_UUID = normalize_uuid_str(c.FTMS_UUID)
+"""Key of the FTMS flags and machine type in the advertisement service data."""
+_WAKE_TIMEOUT = 30.0
+"""Time to wait for the reconnection of the machine woken by a command, seconds."""
+
+
+class ConnectionManager:
+    """
+    Keeps the fitness machine connected without reloading the config entry.
+
+    Entities stay alive and unavailable while the link is down. The same
+    `FitnessMachine` client is reconnected with exponential backoff and jitter.
+    The entry is reloaded only if the machine capabilities were changed.
+
+    Unchanged advertisements are skipped.
+
+    Optionally, idle machine is disconnected to free the adapter slot. It is
+    reconnected when its advertisement changes, e.g. the FTMS "available" flag
+    is set, or when it appears again after being gone.
+    """
+
+    capabilities: Capabilities | None
+    """Persisted capabilities snapshot. Entities are created from it."""
+
+    _task: asyncio.Task[None] | None = None
+    _unsub_scan: CALLBACK_TYPE | None = None
+    _last_advertisement: tuple[str, dict[str, bytes]] | None = None
+    _idle_timeout: float = 0
+    _idle_timer: CALLBACK_TYPE | None = None
+    _unsub_unavailable: CALLBACK_TYPE | None = None
+    _sleeping: bool = False
+    _gone: bool = False
+    _wake_baseline: bool = False
+    _wake_data: bytes | None = None
+    _slept_at: float | None = None
+    """Monotonic time of the idle disconnect. Older advertisements are stale."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        ftms: FitnessMachine,
+        coordinator: DataCoordinator,
+        store: CapabilitiesStore,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._ftms = ftms
+        self._coordinator = coordinator
+        self._store = store
+        self.capabilities = store.get(ftms.address)
+        self._idle_values: dict[str, Any] = {}
+
+    @callback
+    def async_start_scanning(self) -> None:
+        """Register the advertisements callback."""
+
+        self._unsub_scan = bluetooth.async_register_callback(
+            self._hass,
+            self._async_on_advertisement,
+            BluetoothCallbackMatcher(address=self._ftms.address),
+            bluetooth.BluetoothScanningMode.ACTIVE,
+        )
+
+    @callback
+    def async_stop_scanning(self) -> None:
+        if self._unsub_scan:
+            self._unsub_scan()
+            self._unsub_scan = None
+
+    @callback
+    def _async_on_advertisement(
+        self,
+        srv_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        """Update the device and advertisement of the client if changed."""
+
+        metrics = self._coordinator.metrics
+        metrics.on_advertisement()
+
+        # Machines advertise several times per second, mostly the same data.
+        if (x := (srv_info.source, srv_info.service_data)) != self._last_advertisement:
+            self._last_advertisement = x
+            metrics.on_advertisement_processed()
+
+            self._ftms.set_ble_device_and_advertisement_data(
+                srv_info.device, srv_info.advertisement
+            )
+
+        if not self._sleeping:
+            return
+
+        data = srv_info.service_data.get(_FTMS_SERVICE_UUID)
+
+        # Flags may differ from the ones before the idle disconnect. Cached
+        # advertisement may be replayed on the callback registration.
+        if not self._wake_baseline:
+            if self._slept_at is not None and srv_info.time >= self._slept_at:
+                self._wake_baseline, self._wake_data = True, data
+
+        elif self._gone or data != self._wake_data:
+            _LOGGER.info("'%s' is active again. Reconnecting.", self._ftms.name)
+            self._async_wake()
+
+    @callback
+    def async_set_idle_timeout(self, seconds: float) -> None:
+        """Set idle time before disconnect. `0` - never."""
+
+        self._idle_timeout = seconds
+        self._async_check_idle()
+
+    @callback
+    def async_on_event(self, e: FtmsEvents) -> None:
+        """Coordinator events listener. Tracks the idle state of the machine."""
+
+        if e.event_id != "update":
+            return
+
+        for k in _IDLE_PROPERTIES:
+            if (x := e.event_data.get(k)) is not None:
+                self._idle_values[k] = x
+
+        self._async_check_idle()
+
+    @callback
+    def _async_check_idle(self) -> None:
+        """Start the idle timer if idle, stop it otherwise."""
+
+        values = self._idle_values
+        idle = (
+            self._idle_timeout
+            and self._ftms.is_connected
+            and values.get(c.TRAINING_STATUS, TrainingStatusCode.IDLE)
+            == TrainingStatusCode.IDLE
+            and not values.get(c.SPEED_INSTANT)
+            and not values.get(c.CADENCE_INSTANT)
+        )
+
+        if not idle:
+            if self._idle_timer:
+                self._idle_timer()
+                self._idle_timer = None
+
+        elif self._idle_timer is None:
+            self._idle_timer = async_call_later(
+                self._hass, self._idle_timeout, self._async_on_idle
+            )
+
+    @callback
+    def _async_on_idle(self, _: Any) -> None:
+        """Machine is idle for the timeout. Disconnect until it is active again."""
+
+        self._idle_timer, ftms = None, self._ftms
+
+        if not ftms.is_connected:
+            return
+
+        _LOGGER.info("'%s' is idle. Disconnecting.", ftms.name)
+
+        self._sleeping, self._gone, self._wake_baseline = True, False, False
+        self._slept_at = None
+
+        @callback
+        def _async_on_unavailable(_: bluetooth.BluetoothServiceInfoBleak) -> None:
+            self._gone = True
+
+        self._unsub_unavailable = bluetooth.async_track_unavailable(
+            self._hass, _async_on_unavailable, ftms.address, connectable=True
+        )
+
+        self._entry.async_create_background_task(
+            self._hass, ftms.disconnect(), f"ftms idle disconnect {ftms.address}"
+        )
+
+    @callback
+    def _async_wake(self) -> None:
+        self.async_cancel_idle()
+        self._ftms.need_connect = True
+        self.async_reconnect()
+
+    async def async_wake(self) -> None:
+        """
+        Reconnect the machine disconnected for idle and wait for the connection.
+
+        Also waits for the running reconnection. Returns on timeout.
+        """
+
+        if self._sleeping:
+            _LOGGER.info("'%s' is requested. Reconnecting.", self._ftms.name)
+            self._async_wake()
+
+        if self._task and not self._task.done():
+            await asyncio.wait((self._task,), timeout=_WAKE_TIMEOUT)
+
+    @callback
+    def async_cancel_idle(self) -> None:
+        """Stop the idle timer and waiting for the wake up."""
+
+        if self._idle_timer:
+            self._idle_timer()
+            self._idle_timer = None
+
+        if self._unsub_unavailable:
+            self._unsub_unavailable()
+            self._unsub_unavailable = None
+
+        self._sleeping = False
+
+    def _machine_type_changed(self) -> bool:
+        """Check last advertisement. Machine may switch to another protocol."""
+
+        if not (
+            info := bluetooth.async_last_service_info(self._hass, self._ftms.address)
+        ):
+            return False
+
+        try:
+            return get_machine_type_from_service_data(info.advertisement) != (
+                self._ftms.machine_type
+            )
+
+        except NotFitnessMachineError:
+            return True
+
+    @callback
+    def async_on_connect(self) -> None:
+        """Connection is established."""
+
+        self._coordinator.metrics.on_connect()
+        self._idle_values.clear()
+        self._async_check_idle()
+
+        if (capabilities := Capabilities.from_client(self._ftms)) != self.capabilities:
+            self._store.async_save(self._ftms.address, capabilities)
+
+            if self.capabilities is not None:
+                _LOGGER.info("Capabilities of '%s' are changed.", self._ftms.name)
+                self._hass.config_entries.async_schedule_reload(self._entry.entry_id)
+                return
+
+            self.capabilities = capabilities
+
+        self._coordinator.async_update_listeners()
+
+    @callback
+    def async_on_disconnect(self) -> None:
+        """Connection is lost. Start reconnection if it is still needed."""
+
+        self._coordinator.metrics.on_disconnect()
+        self._coordinator.async_update_listeners()
+
+        if self._sleeping:
+            self._slept_at = time.monotonic()
+        self._async_check_idle()
+        async_get_placement(self._hass).async_release(self._ftms.address)
+
+        if self._ftms.need_connect:
+            self.async_reconnect()
+
+    async def async_connect(self) -> None:
+        """
+        Connect through a slot of the placed adapter.
+
+        Phases timings are collected to metrics.
+        """
+
+        ftms, metrics = self._ftms, self._coordinator.metrics
+        placement, source = async_get_placement(self._hass), ""
+
+        if (device := placement.async_place(ftms.address)) is not None:
+            source = device.scanner.source
+            ftms.set_ble_device_and_advertisement_data(
+                device.ble_device, device.advertisement
+            )
+
+        start = time.monotonic()
+
+        try:
+            async with placement.slot(source):
+                metrics.on_phase("wait_slot", (connected := time.monotonic()) - start)
+
+                # Connection, services discovery, reading of static information and
+                # subscription to notifications are made by single `pyftms` call.
+                await ftms.connect()
+
+        except BaseException:
+            placement.async_release(ftms.address)
+            raise
+
+        metrics.on_phase("connect", time.monotonic() - connected)
+
+    @callback
+    def async_reconnect(self) -> None:
+        """Start reconnection in background."""
+
+        if self._task and not self._task.done():
+            return
+
+        self._task = self._entry.async_create_background_task(
+            self._hass,
+            self._async_reconnect(),
+            f"ftms reconnect {self._ftms.address}",
+        )
+
+    async def _async_reconnect(self) -> None:
+        delay, ftms = _BACKOFF_MIN, self._ftms
+
+        while ftms.need_connect and not ftms.is_connected:
+            if self._machine_type_changed():
+                _LOGGER.info("Machine type of '%s' is changed.", ftms.name)
+                self._hass.config_entries.async_schedule_reload(self._entry.entry_id)
+                return
+
+            try:
+                await self.async_connect()
+
+            except (BleakError, TimeoutError) as exc:
+                _LOGGER.debug("Reconnection to '%s' failed: %s", ftms.name, exc)
+
+            # Unexpected errors of the client must not stop the reconnection.
+            except Exception:
+                _LOGGER.exception("Unexpected error reconnecting to '%s'", ftms.name)
+
+            else:
+                self.async_on_connect()
+                return
+
+            # Full jitter. Spreads reconnection of many machines after an outage.
+            await asyncio.sleep(random.uniform(0, delay))
+            delay = min(delay * 2, _BACKOFF_MAX)
@@ -1,3 +1,29 @@
 """Constants for the FTMS integration."""
 
 DOMAIN = "ftms"
+
+CONF_MAX_UPDATE_RATE = "max_update_rate"
+"""Maximum state writes per second of instantaneous sensors. `0` - unlimited."""
+
+CONF_MAX_HEART_RATE = "max_heart_rate"
+"""Maximum heart rate of the user. Heart rate zones are based on it."""
+DEFAULT_MAX_HEART_RATE = 190
+
+CONF_DERIVED_SENSORS = "derived_sensors"
+"""Create sensors of the metrics computed by the integration."""
+CONF_AVERAGE_WINDOW = "average_window"
+"""Window of the derived rolling averages, seconds."""
+DEFAULT_AVERAGE_WINDOW = 60
+CONF_WEIGHT = "weight"
+"""Weight of the user for the power-to-weight ratio, kg. `0` - not used."""
+
+CONF_STATISTICS = "statistics"
+"""Import hourly long-term statistics of the training data."""
+
+CONF_IDLE_TIMEOUT = "idle_timeout"
+"""Disconnect the idle machine after this time, minutes. `0` - never."""
+
+DISCOVERY_TIMEOUT = 30.0
+"""Upper bound of automatic discovery of live properties, seconds."""
+DISCOVERY_QUIET_PERIOD = 5.0
+"""Discovery ends when no new live properties appear within this period, seconds."""
@@ -0,0 +1,210 @@
+"""Control point commands of the FTMS integration."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from pyftms import FitnessMachine, ResultCode
+from pyftms.client import const as c
+
+from .connection import ConnectionManager
+from .const import DOMAIN
+from .metrics import FtmsMetrics
+
+_LOGGER = logging.getLogger(__name__)
+
+_CONTROL_COMMANDS = {
+    c.RESET: "reset",
+    c.START: "start_resume",
+    c.STOP: "stop",
+    c.PAUSE: "pause",
+}
+"""Control commands and methods of the client."""
+
+_PRIORITY_COMMANDS = (c.STOP, c.PAUSE)
+"""Safety commands. Executed before the queued ones, which drop queued start."""
+_FLUSH_COMMANDS = (c.STOP, c.RESET)
+"""Commands making the queued setting writes obsolete."""
+
+type _Queue = dict[str, tuple[Any, asyncio.Future[ResultCode], float]]
+"""Queued commands: value, result future and enqueue time of the oldest request."""
+
+
+async def async_wait(future: asyncio.Future[ResultCode]) -> ResultCode | None:
+    """
+    Wait for the command result. `None` if the command is dropped.
+
+    Cancellation of the waiter does not cancel the command, which may be shared
+    by coalesced requests.
+    """
+
+    await asyncio.wait((future,))
+
+    return None if future.cancelled() else future.result()
+
+
+class CommandScheduler:
+    """
+    Sequential scheduler of the control point commands.
+
+    Control point handles one request at a time: the next one may be written
+    only after the response to the previous one. Stop and pause preempt the
+    queued commands. Requests of a setting made while waiting are coalesced to
+    the latest value, so ramps and slider drags do not pile up on the machine.
+    Stop and reset drop the queued setting writes. Machine disconnected for
+    idle is reconnected before the command. Commands fail while disconnected.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        ftms: FitnessMachine,
+        connection: ConnectionManager,
+        metrics: FtmsMetrics,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._ftms = ftms
+        self._connection = connection
+        self._metrics = metrics
+        self._priority: _Queue = {}
+        self._queue: _Queue = {}
+        self._writing: dict[str, Any] = {}
+        self._task: asyncio.Task | None = None
+        self.acknowledged: dict[str, Any] = {}
+        """Last values of settings confirmed by the machine."""
+
+    def pending(self, key: str) -> Any | None:
+        """Requested value of the setting not confirmed yet."""
+
+        if (x := self._queue.get(key)) is not None:
+            return x[0]
+
+        return self._writing.get(key)
+
+    @callback
+    def async_request(self, key: str, value: Any) -> asyncio.Future[ResultCode]:
+        """
+        Request the setting write. Replaces the pending value of the setting.
+
+        Returned future is shared by the coalesced requests and resolved with
+        the result of the write of the latest value.
+        """
+
+        return self._async_enqueue(self._queue, key, value)
+
+    @callback
+    def async_command(self, key: str) -> asyncio.Future[ResultCode]:
+        """Request the control command: `reset`, `start`, `stop` or `pause`."""
+
+        assert key in _CONTROL_COMMANDS
+
+        if key in _FLUSH_COMMANDS:
+            self._async_drop(k for k in self._queue if k not in _CONTROL_COMMANDS)
+
+        if key not in _PRIORITY_COMMANDS:
+            return self._async_enqueue(self._queue, key, None)
+
+        # Start requested earlier must not resume the machine after stop or pause.
+        self._async_drop((c.START,))
+
+        return self._async_enqueue(self._priority, key, None)
+
+    @callback
+    def _async_drop(self, keys: Iterable[str]) -> None:
+        """Drop obsolete queued commands."""
+
+        for key in [k for k in keys if k in self._queue]:
+            _, future, _ = self._queue.pop(key)
+            future.cancel()
+
+            self._metrics.on_command_dropped(key)
+            _LOGGER.debug("Command '%s' is dropped.", key)
+
+    @callback
+    def _async_enqueue(
+        self, queue: _Queue, key: str, value: Any
+    ) -> asyncio.Future[ResultCode]:
+        if (x := queue.get(key)) is not None:
+            _, future, enqueued = x
+            _LOGGER.debug("Command '%s' is coalesced.", key)
+
+        else:
+            future, enqueued = self._hass.loop.create_future(), time.monotonic()
+
+        # Keeps the position in the queue if the command is already pending.
+        queue[key] = value, future, enqueued
+
+        if self._task is None:
+            self._task = self._entry.async_create_background_task(
+                self._hass, self._async_run(), "ftms command scheduler"
+            )
+
+        return future
+
+    async def _async_execute(self, key: str, value: Any) -> ResultCode:
+        if not self._ftms.is_connected:
+            await self._connection.async_wake()
+
+        # Client would connect by itself, past the adapter placement and slots,
+        # racing the reconnection.
+        if not self._ftms.is_connected:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="device_not_connected",
+            )
+
+        if (method := _CONTROL_COMMANDS.get(key)) is not None:
+            return await getattr(self._ftms, method)()
+
+        self._writing[key] = value
+
+        try:
+            return await self._ftms.set_setting(key, value)
+
+        finally:
+            del self._writing[key]
+
+    async def _async_run(self) -> None:
+        try:
+            while queue := self._priority or self._queue:
+                key = next(iter(queue))
+                value, future, enqueued = queue.pop(key)
+
+                try:
+                    result = await self._async_execute(key, value)
+
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+
+                # Raised to the waiters. Queue must keep running whatever it is.
+                except Exception as exc:  # noqa: BLE001
+                    future.set_exception(exc)
+                    continue
+
+                self._metrics.on_command(key, time.monotonic() - enqueued)
+
+                if result != ResultCode.SUCCESS:
+                    _LOGGER.warning("Command '%s' failed: %s.", key, result.name)
+
+                elif key not in _CONTROL_COMMANDS:
+                    self.acknowledged[key] = value
+
+                future.set_result(result)
+
+        finally:
+            self._task = None
+
+            # Unloading: nobody is going to write the rest.
+            for queue in (self._priority, self._queue):
+                for _, future, _ in queue.values():
+                    future.cancel()
+
+                queue.clear()
@@ -1,26 +1,258 @@
 """Data coordinator for receiving FTMS events."""
 
+import asyncio
 import logging
+import time
+from collections import Counter
+from collections.abc import Callable, Mapping
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pyftms import FitnessMachine, FtmsEvents
 
 from .const import DOMAIN
+from .metrics import FtmsMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+type KeyListener = Callable[[Any], None]
+type EventListener = Callable[[FtmsEvents], None]
+
+_DEBUG_SAMPLE_EVERY = 50
+"""Log the full data of every Nth event."""
+_DEBUG_SUMMARY_INTERVAL = 10.0
+"""Interval of the events rate summary, seconds."""
+
+
+class _DebugSampler:
+    """Sampling debug channel of the event hot path. Used only if debug is enabled."""
+
+    __slots__ = ("_counter", "_events", "_since")
+
+    def __init__(self) -> None:
+        self._counter: Counter[str] = Counter()
+        self._events = 0
+        self._since = time.monotonic()
+
+    def __call__(self, data: FtmsEvents) -> None:
+        self._counter[data.event_id] += 1
+
+        if self._events % _DEBUG_SAMPLE_EVERY == 0:
+            _LOGGER.debug("Event data (1 of %d): %s", _DEBUG_SAMPLE_EVERY, data)
+
+        self._events += 1
+
+        if (elapsed := time.monotonic() - self._since) >= _DEBUG_SUMMARY_INTERVAL:
+            _LOGGER.debug(
+                "Received %d events in %.1fs: %s",
+                self._counter.total(),
+                elapsed,
+                dict(self._counter),
+            )
+
+            self._counter.clear()
+            self._since += elapsed
+
 
 class DataCoordinator(DataUpdateCoordinator[FtmsEvents]):
     """FTMS events coordinator."""
 
+    _key_listeners: dict[str, list[KeyListener]]
+    """Subscribers index. Property or setting name -> listeners."""
+
+    _event_listeners: list[EventListener]
+    """Processors of the whole events stream."""
+
+    _live_listeners: list[EventListener]
+    """Processors of the machine events only. Detached during replay."""
+
+    _pending_writes: dict[Entity, float]
+    """
+    Entities with changed state waiting for the batched write pass and
+    monotonic time of the event of the oldest unwritten change.
+    """
+
+    _dispatching: bool
+    _flush_handle: asyncio.Handle | None
+
+    _debug: _DebugSampler | None = None
+
+    _event_time: float
+    """Monotonic time of the last received event."""
+
+    metrics: FtmsMetrics
+
+    replaying: bool
+    """Recorded events are fed instead of the machine ones."""
+
     def __init__(self, hass: HomeAssistant, ftms: FitnessMachine) -> None:
         """Initialize the coordinator."""
 
-        def _on_ftms_event(data: FtmsEvents):
-            _LOGGER.debug(f"Event data: {data}")
-            self.async_set_updated_data(data)
-
         super().__init__(hass, _LOGGER, name=DOMAIN)
 
-        ftms.set_callback(_on_ftms_event)
+        self._key_listeners = {}
+        self._event_listeners = []
+        self._live_listeners = []
+        self._pending_writes = {}
+        self._dispatching = False
+        self._flush_handle = None
+        self._event_time = time.monotonic()
+        self.metrics = FtmsMetrics()
+        self.replaying = False
+
+        ftms.set_callback(self.async_handle_event)
+
+    @callback
+    def async_add_key_listener(
+        self, key: str, update_callback: KeyListener
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of a single property or setting."""
+
+        listeners = self._key_listeners.setdefault(key, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+
+            listeners.remove(update_callback)
+
+            if not listeners:
+                del self._key_listeners[key]
+
+        return remove_listener
+
+    @callback
+    def async_add_event_listener(
+        self, event_callback: EventListener, live: bool = False
+    ) -> CALLBACK_TYPE:
+        """
+        Listen for all FTMS events. Called before entities are updated.
+
+        Live listeners keep the state of the real workout and are not fed with
+        the replayed events.
+        """
+
+        listeners = self._live_listeners if live else self._event_listeners
+        listeners.append(event_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove event listener."""
+
+            listeners.remove(event_callback)
+
+        return remove_listener
+
+    @callback
+    def async_set_replaying(self, replaying: bool) -> None:
+        """Switch the replay mode. Entities are available while replaying."""
+
+        self.replaying = replaying
+        self.async_update_listeners()
+
+    @property
+    def event_time(self) -> float:
+        """Monotonic time of the last received event."""
+        return self._event_time
+
+    @callback
+    def async_schedule_write(
+        self, entity: Entity, event_time: float | None = None
+    ) -> None:
+        """
+        Schedule the entity state write in the next batched pass.
+
+        Write latency is measured from `event_time`, the last event by default.
+        Deferred writes pass the time of the event they publish.
+        """
+
+        if event_time is None:
+            event_time = self._event_time
+
+        self._pending_writes.setdefault(entity, event_time)
+
+        # Writes made while dispatching an event are flushed at the end of it.
+        if not self._dispatching and self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._async_flush_writes)
+
+    @callback
+    def async_cancel_write(self, entity: Entity) -> None:
+        """Cancel the scheduled entity state write."""
+
+        self._pending_writes.pop(entity, None)
+
+    @callback
+    def _async_flush_writes(self) -> None:
+        """Write the states of all changed entities in a single pass."""
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending_writes = self._pending_writes, {}
+
+        for entity, event_time in pending.items():
+            entity.async_write_ha_state()
+
+            latency = time.monotonic() - event_time
+            self.metrics.on_write(entity.entity_id, latency)
+
+    @callback
+    def async_handle_event(self, data: FtmsEvents) -> None:
+        """
+        FTMS event handler. Dispatches changed values to its subscribers only.
+
+        Also used to replay recorded events.
+        """
+
+        self._event_time = now = time.monotonic()
+        self.metrics.on_event(data.event_id, now)
+
+        # `isEnabledFor` is cached by logger, so disabled path costs nothing.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            if self._debug is None:
+                self._debug = _DebugSampler()
+
+            self._debug(data)
+
+        self.data = data
+
+        for event_listener in self._event_listeners:
+            event_listener(data)
+
+        if not self.replaying:
+            for event_listener in self._live_listeners:
+                event_listener(data)
+
+        if data.event_id == "update":
+            self.metrics.on_update(data.event_data.keys())
+
+        if data.event_id == "update" or data.event_id == "setup":
+            self.async_dispatch(data.event_data)
+
+    @callback
+    def async_dispatch(self, data: Mapping[str, Any], unknown: bool = False) -> None:
+        """
+        Dispatch values to the key subscribers and write changed states at once.
+
+        `None` values are skipped, unless `unknown` states are dispatched.
+        """
+
+        index, nested = self._key_listeners, self._dispatching
+        self._dispatching = True
+
+        try:
+            for key, value in data.items():
+                if (value is not None or unknown) and (listeners := index.get(key)):
+                    for listener in listeners:
+                        listener(value)
+
+        finally:
+            self._dispatching = nested
+
+        # Nested dispatch is flushed by the outer one.
+        if self._pending_writes and not nested:
+            self._async_flush_writes()
@@ -0,0 +1,34 @@
+"""Diagnostics support for the FTMS integration."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+
+from . import FtmsConfigEntry
+from .placement import async_get_placement
+
+TO_REDACT = {CONF_ADDRESS, "serial_number"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: FtmsConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    data = entry.runtime_data
+    ftms, caps = data.ftms, data.capabilities
+
+    return {
+        "entry": async_redact_data(
+            {"data": dict(entry.data), "options": dict(entry.options)}, TO_REDACT
+        ),
+        "device": {
+            "capabilities": async_redact_data(caps.as_dict(), TO_REDACT),
+            "is_connected": ftms.is_connected,
+            "rssi": ftms.rssi,
+        },
+        "adapters_load": async_get_placement(hass).as_dict(),
+        "performance": data.coordinator.metrics.as_dict(),
+    }
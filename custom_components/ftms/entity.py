@@ -1,10 +1,10 @@
 """FTMS integration base entity."""
 
 import logging
+from typing import Any, override
 
 from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity, EntityDescription
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DataCoordinator, FtmsConfigEntry
 from .models import FtmsData
@@ -12,13 +12,14 @@ from .models import FtmsData
 _LOGGER = logging.getLogger(__name__)
 
 
-class FtmsEntity(CoordinatorEntity[DataCoordinator], Entity):
+class FtmsEntity(Entity):
     """Base Entity"""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
 
     _data: FtmsData
+    coordinator: DataCoordinator
 
     def __init__(
         self,
@@ -30,21 +31,58 @@ class FtmsEntity(CoordinatorEntity[DataCoordinator], Entity):
         self._attr_unique_id = f"{self._data.unique_id}-{self.key}"
         self._attr_device_info = self._data.device_info
         self._attr_translation_key = self.key
+        self.coordinator = self._data.coordinator
 
-        super().__init__(self._data.coordinator)
+    @override
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator for the entity keys only."""
+
+        await super().async_added_to_hass()
+
+        # Broadcast updates are sent only on connection state changes.
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state)
+        )
+
+        for key in self.listen_keys:
+            self.async_on_remove(
+                self.coordinator.async_add_key_listener(
+                    key, self._handle_coordinator_update
+                )
+            )
+
+    @override
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop the scheduled state write."""
+
+        self.coordinator.async_cancel_write(self)
+
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def async_schedule_write(self, event_time: float | None = None) -> None:
+        """Write the state in the coordinator batched pass."""
+
+        self.coordinator.async_schedule_write(self, event_time)
 
     @property
     def key(self) -> str:
         return self.entity_description.key
 
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        """Properties and settings the entity is interested in."""
+        return ()
+
     @property
     def available(self) -> bool:
-        return self.ftms.is_connected and super().available
+        connected = self.ftms.is_connected or self.coordinator.replaying
+        return connected and self.coordinator.last_update_success
 
     @property
     def ftms(self):
         return self._data.ftms
 
     @callback
-    def _handle_coordinator_update(self) -> None:
-        pass
+    def _handle_coordinator_update(self, value: Any) -> None:
+        """Handle changed value of one of `listen_keys`."""
@@ -0,0 +1,431 @@
+"""Workout export to FIT, TCX and CSV files."""
+
+import datetime as dt
+import math
+import struct
+from collections.abc import Iterator
+from typing import IO, Literal
+
+from pyftms import MachineType
+from pyftms.client import const as c
+
+from .session import SessionBuffer
+
+type ExportFormat = Literal["csv", "fit", "tcx"]
+
+EXPORT_FORMATS: tuple[ExportFormat, ...] = ("csv", "fit", "tcx")
+
+_CHUNK_ROWS = 1024
+"""Rows formatted and written to the file at once."""
+
+_COLUMNS = (
+    c.POWER_INSTANT,
+    c.CADENCE_INSTANT,
+    c.SPEED_INSTANT,
+    c.HEART_RATE,
+    c.DISTANCE_TOTAL,
+    c.ELEVATION_GAIN_POSITIVE,
+    c.ELEVATION_GAIN_NEGATIVE,
+)
+"""Exported properties. Only recorded ones are written."""
+
+
+def _isoformat(timestamp: float) -> str:
+    return dt.datetime.fromtimestamp(timestamp, dt.UTC).isoformat(
+        timespec="milliseconds"
+    )
+
+
+def _per_second(session: SessionBuffer, columns: list[str]) -> Iterator[tuple]:
+    """Last row of each second. FIT and TCX tools expect 1 Hz records."""
+
+    prev: tuple | None = None
+
+    for row in session.rows(columns):
+        if prev is not None and int(row[0]) != int(prev[0]):
+            yield prev
+
+        prev = row
+
+    if prev is not None:
+        yield prev
+
+
+def _write_csv(f: IO[bytes], session: SessionBuffer, columns: list[str]) -> None:
+    f.write(",".join(("time", *columns)).encode() + b"\n")
+
+    chunk: list[str] = []
+    second, prefix = -1, ""
+    values = ",%g" * len(columns)
+
+    for row in session.rows(columns):
+        # Date formatting is the most expensive part. Do it once per second.
+        if (x := int(t := row[0])) != second:
+            second = x
+            prefix = dt.datetime.fromtimestamp(x, dt.UTC).strftime("%Y-%m-%dT%H:%M:%S")
+
+        line = f"{prefix}.{int((t - second) * 1000):03d}Z" + values % row[1:]
+        chunk.append(line.replace("nan", ""))
+
+        if len(chunk) == _CHUNK_ROWS:
+            f.write("\n".join(chunk).encode() + b"\n")
+            chunk.clear()
+
+    if chunk:
+        f.write("\n".join(chunk).encode() + b"\n")
+
+
+_TCX_SPORTS = {
+    MachineType.INDOOR_BIKE: "Biking",
+    MachineType.TREADMILL: "Running",
+}
+
+
+def _write_tcx(
+    f: IO[bytes],
+    session: SessionBuffer,
+    columns: list[str],
+    machine_type: MachineType,
+) -> None:
+    start, end = session.start_time, session.end_time
+
+    if start is None or end is None:
+        raise ValueError("Session is empty")
+
+    start_time = _isoformat(start)
+    distance = session.last(c.DISTANCE_TOTAL)
+
+    f.write(
+        (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<TrainingCenterDatabase xmlns="http://www.garmin.com/xmlschemas/'
+            'TrainingCenterDatabase/v2" xmlns:ns3="http://www.garmin.com/xmlschemas/'
+            'ActivityExtension/v2">\n'
+            "<Activities>\n"
+            f'<Activity Sport="{_TCX_SPORTS.get(machine_type, "Other")}">\n'
+            f"<Id>{start_time}</Id>\n"
+            f'<Lap StartTime="{start_time}">\n'
+            f"<TotalTimeSeconds>{end - start:.0f}</TotalTimeSeconds>\n"
+            f"<DistanceMeters>{0 if math.isnan(distance) else distance:.0f}"
+            "</DistanceMeters>\n"
+            "<Intensity>Active</Intensity>\n"
+            "<TriggerMethod>Manual</TriggerMethod>\n"
+            "<Track>\n"
+        ).encode()
+    )
+
+    get = dict.fromkeys(_COLUMNS, -1) | {k: i + 1 for i, k in enumerate(columns)}
+    chunk: list[str] = []
+
+    def value(row: tuple, key: str) -> float | None:
+        if (i := get[key]) < 0 or math.isnan(x := row[i]):
+            return None
+
+        return x
+
+    for row in _per_second(session, columns):
+        point = [f"<Trackpoint><Time>{_isoformat(row[0])}</Time>"]
+
+        if (gain := value(row, c.ELEVATION_GAIN_POSITIVE)) is not None:
+            loss = value(row, c.ELEVATION_GAIN_NEGATIVE) or 0
+            point.append(f"<AltitudeMeters>{gain - loss:.1f}</AltitudeMeters>")
+
+        if (x := value(row, c.DISTANCE_TOTAL)) is not None:
+            point.append(f"<DistanceMeters>{x:.1f}</DistanceMeters>")
+
+        if (x := value(row, c.HEART_RATE)) is not None:
+            point.append(f"<HeartRateBpm><Value>{x:.0f}</Value></HeartRateBpm>")
+
+        if (x := value(row, c.CADENCE_INSTANT)) is not None:
+            point.append(f"<Cadence>{min(x, 254):.0f}</Cadence>")
+
+        speed, power = value(row, c.SPEED_INSTANT), value(row, c.POWER_INSTANT)
+
+        if speed is not None or power is not None:
+            point.append("<Extensions><ns3:TPX>")
+
+            if speed is not None:
+                point.append(f"<ns3:Speed>{speed / 3.6:.3f}</ns3:Speed>")
+
+            if power is not None:
+                point.append(f"<ns3:Watts>{power:.0f}</ns3:Watts>")
+
+            point.append("</ns3:TPX></Extensions>")
+
+        point.append("</Trackpoint>\n")
+        chunk.append("".join(point))
+
+        if len(chunk) == _CHUNK_ROWS:
+            f.write("".join(chunk).encode())
+            chunk.clear()
+
+    chunk.append("</Track>\n</Lap>\n</Activity>\n</Activities>\n")
+    chunk.append("</TrainingCenterDatabase>\n")
+    f.write("".join(chunk).encode())
+
+
+_FIT_EPOCH = 631065600
+"""FIT epoch (1989-12-31T00:00:00Z) as UNIX timestamp."""
+
+_FIT_CRC_TABLE = (
+    0x0000,
+    0xCC01,
+    0xD801,
+    0x1400,
+    0xF001,
+    0x3C00,
+    0x2800,
+    0xE401,
+    0xA001,
+    0x6C00,
+    0x7800,
+    0xB401,
+    0x5000,
+    0x9C01,
+    0x8801,
+    0x4400,
+)
+
+
+def _fit_crc(crc: int, data: bytes) -> int:
+    for byte in data:
+        tmp = _FIT_CRC_TABLE[crc & 0xF]
+        crc = (crc >> 4) & 0x0FFF
+        crc = crc ^ tmp ^ _FIT_CRC_TABLE[byte & 0xF]
+        tmp = _FIT_CRC_TABLE[crc & 0xF]
+        crc = (crc >> 4) & 0x0FFF
+        crc = crc ^ tmp ^ _FIT_CRC_TABLE[(byte >> 4) & 0xF]
+
+    return crc
+
+
+def _fit_definition(
+    local: int, global_num: int, fields: tuple[tuple[int, int, int], ...]
+) -> bytes:
+    """Definition message. Fields are tuples of number, size and base type."""
+
+    header = struct.pack("<BBBHB", 0x40 | local, 0, 0, global_num, len(fields))
+    return header + bytes(x for field in fields for x in field)
+
+
+_FIT_FILE_ID_DEF = _fit_definition(
+    0,
+    0,
+    (
+        (0, 1, 0x00),  # type
+        (1, 2, 0x84),  # manufacturer
+        (2, 2, 0x84),  # product
+        (4, 4, 0x86),  # time_created
+    ),
+)
+_FIT_FILE_ID = struct.Struct("<BBHHI")
+_FIT_RECORD_DEF = _fit_definition(
+    1,
+    20,
+    (
+        (253, 4, 0x86),  # timestamp, s
+        (3, 1, 0x02),  # heart_rate, bpm
+        (4, 1, 0x02),  # cadence, rpm
+        (5, 4, 0x86),  # distance, 1/100 m
+        (6, 2, 0x84),  # speed, 1/1000 m/s
+        (7, 2, 0x84),  # power, W
+        (2, 2, 0x84),  # altitude, 1/5 m - 500
+    ),
+)
+_FIT_RECORD = struct.Struct("<BIBBIHHH")
+_FIT_LAP_DEF = _fit_definition(
+    2,
+    19,
+    (
+        (254, 2, 0x84),  # message_index
+        (253, 4, 0x86),  # timestamp, s
+        (0, 1, 0x00),  # event
+        (1, 1, 0x00),  # event_type
+        (2, 4, 0x86),  # start_time, s
+        (7, 4, 0x86),  # total_elapsed_time, ms
+        (8, 4, 0x86),  # total_timer_time, ms
+        (9, 4, 0x86),  # total_distance, 1/100 m
+        (24, 1, 0x00),  # lap_trigger
+        (25, 1, 0x00),  # sport
+    ),
+)
+_FIT_LAP = struct.Struct("<BHIBBIIIIBB")
+_FIT_SESSION_DEF = _fit_definition(
+    3,
+    18,
+    (
+        (254, 2, 0x84),  # message_index
+        (253, 4, 0x86),  # timestamp, s
+        (0, 1, 0x00),  # event
+        (1, 1, 0x00),  # event_type
+        (2, 4, 0x86),  # start_time, s
+        (5, 1, 0x00),  # sport
+        (6, 1, 0x00),  # sub_sport
+        (7, 4, 0x86),  # total_elapsed_time, ms
+        (8, 4, 0x86),  # total_timer_time, ms
+        (9, 4, 0x86),  # total_distance, 1/100 m
+        (25, 2, 0x84),  # first_lap_index
+        (26, 2, 0x84),  # num_laps
+        (28, 1, 0x00),  # trigger
+    ),
+)
+_FIT_SESSION = struct.Struct("<BHIBBIBBIIIHHB")
+_FIT_ACTIVITY_DEF = _fit_definition(
+    4,
+    34,
+    (
+        (253, 4, 0x86),  # timestamp, s
+        (0, 4, 0x86),  # total_timer_time, ms
+        (1, 2, 0x84),  # num_sessions
+        (2, 1, 0x00),  # type
+        (3, 1, 0x00),  # event
+        (4, 1, 0x00),  # event_type
+    ),
+)
+_FIT_ACTIVITY = struct.Struct("<BIIHBBB")
+
+_FIT_SPORTS = {
+    MachineType.TREADMILL: (1, 1),  # running, treadmill
+    MachineType.INDOOR_BIKE: (2, 6),  # cycling, indoor_cycling
+    MachineType.ROWER: (15, 14),  # rowing, indoor_rowing
+    MachineType.CROSS_TRAINER: (4, 15),  # fitness_equipment, elliptical
+}
+"""Sport and sub-sport of the machines."""
+
+
+def _fit_value(x: float | None, scale: float, offset: float, invalid: int) -> int:
+    if x is None or math.isnan(x):
+        return invalid
+
+    return min(max(round((x + offset) * scale), 0), invalid - 1)
+
+
+def _fit_summary(session: SessionBuffer, machine_type: MachineType) -> bytes:
+    """Lap, session and activity messages required by activity files."""
+
+    start, end = session.start_time, session.end_time
+
+    if start is None or end is None:
+        raise ValueError("Session is empty")
+
+    timestamp, start_time = int(end) - _FIT_EPOCH, int(start) - _FIT_EPOCH
+    duration = _fit_value(end - start, 1000, 0, 0xFFFFFFFF)
+    distance = _fit_value(session.last(c.DISTANCE_TOTAL), 100, 0, 0xFFFFFFFF)
+    sport, sub_sport = _FIT_SPORTS.get(machine_type, (0, 0))
+
+    # Events: lap (9), session (8) and activity (26) stop (1). Without pauses,
+    # timer time is the elapsed time.
+    lap = _FIT_LAP.pack(
+        0x02, 0, timestamp, 9, 1, start_time, duration, duration, distance, 7, sport
+    )
+    summary = _FIT_SESSION.pack(
+        0x03,
+        0,
+        timestamp,
+        8,
+        1,
+        start_time,
+        sport,
+        sub_sport,
+        duration,
+        duration,
+        distance,
+        0,
+        1,
+        0,
+    )
+    activity = _FIT_ACTIVITY.pack(0x04, timestamp, duration, 1, 0, 26, 1)
+
+    return b"".join(
+        (
+            _FIT_LAP_DEF,
+            lap,
+            _FIT_SESSION_DEF,
+            summary,
+            _FIT_ACTIVITY_DEF,
+            activity,
+        )
+    )
+
+
+def _write_fit(
+    f: IO[bytes],
+    session: SessionBuffer,
+    columns: list[str],
+    machine_type: MachineType,
+) -> None:
+    if (start := session.start_time) is None:
+        raise ValueError("Session is empty")
+
+    summary = _fit_summary(session, machine_type)
+
+    # Data size is known in advance: all records have the same size.
+    records = sum(1 for _ in _per_second(session, []))
+    size = len(_FIT_FILE_ID_DEF) + _FIT_FILE_ID.size + len(_FIT_RECORD_DEF)
+    size += records * _FIT_RECORD.size + len(summary)
+
+    header = struct.pack("<BBHI4s", 14, 0x10, 2132, size, b".FIT")
+    header += struct.pack("<H", _fit_crc(0, header))
+
+    # Activity file, development manufacturer.
+    file_id = _FIT_FILE_ID.pack(0x00, 4, 255, 0, int(start) - _FIT_EPOCH)
+    chunk = bytearray(header + _FIT_FILE_ID_DEF + file_id + _FIT_RECORD_DEF)
+    crc = 0
+
+    get = dict.fromkeys(_COLUMNS, -1) | {k: i + 1 for i, k in enumerate(columns)}
+
+    def value(row: tuple, key: str) -> float | None:
+        return None if (i := get[key]) < 0 else row[i]
+
+    for n, row in enumerate(_per_second(session, columns), 1):
+        gain = value(row, c.ELEVATION_GAIN_POSITIVE)
+        loss = value(row, c.ELEVATION_GAIN_NEGATIVE)
+
+        if gain is not None and loss is not None and not math.isnan(loss):
+            gain -= loss
+
+        speed = value(row, c.SPEED_INSTANT)
+
+        chunk += _FIT_RECORD.pack(
+            0x01,
+            int(row[0]) - _FIT_EPOCH,
+            _fit_value(value(row, c.HEART_RATE), 1, 0, 0xFF),
+            _fit_value(value(row, c.CADENCE_INSTANT), 1, 0, 0xFF),
+            _fit_value(value(row, c.DISTANCE_TOTAL), 100, 0, 0xFFFFFFFF),
+            _fit_value(None if speed is None else speed / 3.6, 1000, 0, 0xFFFF),
+            _fit_value(value(row, c.POWER_INSTANT), 1, 0, 0xFFFF),
+            _fit_value(gain, 5, 500, 0xFFFF),
+        )
+
+        if n % _CHUNK_ROWS == 0:
+            crc = _fit_crc(crc, chunk)
+            f.write(chunk)
+            chunk.clear()
+
+    chunk += summary
+    crc = _fit_crc(crc, chunk)
+    f.write(chunk + struct.pack("<H", crc))
+
+
+def write_session(
+    f: IO[bytes],
+    session: SessionBuffer,
+    fmt: ExportFormat,
+    machine_type: MachineType,
+) -> None:
+    """
+    Streams the session to a binary file object in chunks. Blocking.
+
+    Session must not be modified while writing. Export a `copy()` of a live one.
+    """
+
+    columns = [x for x in _COLUMNS if x in session.columns]
+
+    if fmt == "csv":
+        _write_csv(f, session, columns)
+
+    elif fmt == "tcx":
+        _write_tcx(f, session, columns, machine_type)
+
+    else:
+        _write_fit(f, session, columns, machine_type)
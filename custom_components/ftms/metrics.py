@@ -0,0 +1,190 @@
+"""Performance counters of the FTMS integration."""
+
+import logging
+import time
+from collections import Counter, deque
+from collections.abc import Iterable
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+_RATE_WINDOW = 60
+"""Window of events rate counters, seconds."""
+_LATENCY_SAMPLES = 1024
+"""Number of last callback latency samples."""
+_COMMAND_SAMPLES = 256
+"""Number of last control point command latency samples."""
+_RECONNECT_SAMPLES = 32
+"""Number of last time-to-reconnect samples."""
+
+
+class RateCounter:
+    """Events per second counter over a sliding window of one second buckets."""
+
+    __slots__ = ("_buckets", "_second", "total")
+
+    def __init__(self) -> None:
+        self._buckets = [0] * _RATE_WINDOW
+        self._second = int(time.monotonic())
+        self.total = 0
+
+    def _advance(self, now: int) -> None:
+        """Clear the buckets of elapsed seconds."""
+
+        if (elapsed := now - self._second) <= 0:
+            return
+
+        for i in range(1, min(elapsed, _RATE_WINDOW) + 1):
+            self._buckets[(self._second + i) % _RATE_WINDOW] = 0
+
+        self._second = now
+
+    def add(self, now: float) -> None:
+        self._advance(second := int(now))
+        self._buckets[second % _RATE_WINDOW] += 1
+        self.total += 1
+
+    def rate(self) -> float:
+        """Average events rate over the window."""
+
+        self._advance(int(time.monotonic()))
+        return sum(self._buckets) / _RATE_WINDOW
+
+
+def _percentiles(samples: deque[float]) -> dict[str, float] | None:
+    """Latency percentiles in milliseconds."""
+
+    if not samples:
+        return None
+
+    x, n = sorted(samples), len(samples)
+
+    return {
+        f"p{p}": round(x[min(n * p // 100, n - 1)] * 1000, 3) for p in (50, 90, 99)
+    } | {"max": round(x[-1] * 1000, 3)}
+
+
+class FtmsMetrics:
+    """Hot path counters. Fixed-size structures, cheap enough to stay always on."""
+
+    __slots__ = (
+        "_disconnected_at",
+        "advertisements",
+        "advertisements_processed",
+        "command_latency",
+        "commands",
+        "connects",
+        "disconnects",
+        "dropped_commands",
+        "events",
+        "latency",
+        "phases",
+        "properties",
+        "reconnect_time",
+        "suppressed",
+        "writes",
+    )
+
+    def __init__(self) -> None:
+        self.events: dict[str, RateCounter] = {}
+        self.properties: Counter[str] = Counter()
+        self.writes: Counter[str] = Counter()
+        self.suppressed: Counter[str] = Counter()
+        self.latency: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+        self.commands: Counter[str] = Counter()
+        self.dropped_commands: Counter[str] = Counter()
+        self.command_latency: deque[float] = deque(maxlen=_COMMAND_SAMPLES)
+        self.reconnect_time: deque[float] = deque(maxlen=_RECONNECT_SAMPLES)
+        self.phases: dict[str, float] = {}
+        self.connects = 0
+        self.disconnects = 0
+        self.advertisements = 0
+        self.advertisements_processed = 0
+        self._disconnected_at: float | None = None
+
+    def on_event(self, event_id: str, now: float) -> None:
+        """FTMS event is received."""
+
+        if (counter := self.events.get(event_id)) is None:
+            counter = self.events[event_id] = RateCounter()
+
+        counter.add(now)
+
+    def on_update(self, keys: Iterable[str]) -> None:
+        """Properties are updated."""
+
+        self.properties.update(keys)
+
+    def on_write(self, entity_id: str, latency: float) -> None:
+        """Entity state is written. Latency is measured from receiving the event."""
+
+        self.writes[entity_id] += 1
+        self.latency.append(latency)
+
+    def on_suppressed(self, entity_id: str) -> None:
+        """Entity state write is skipped or coalesced."""
+
+        self.suppressed[entity_id] += 1
+
+    def on_advertisement(self) -> None:
+        """Advertisement callback is received."""
+
+        self.advertisements += 1
+
+    def on_advertisement_processed(self) -> None:
+        """Changed advertisement is passed to the client."""
+
+        self.advertisements_processed += 1
+
+    def on_command(self, key: str, latency: float) -> None:
+        """Control point command is acknowledged. Latency is measured from enqueue."""
+
+        self.commands[key] += 1
+        self.command_latency.append(latency)
+
+    def on_command_dropped(self, key: str) -> None:
+        """Queued command is obsolete and dropped."""
+
+        self.dropped_commands[key] += 1
+
+    def on_phase(self, phase: str, duration: float) -> None:
+        """Setup or connection phase is completed."""
+
+        self.phases[phase] = duration
+        _LOGGER.debug("Phase '%s' took %.3fs.", phase, duration)
+
+    def on_connect(self) -> None:
+        self.connects += 1
+
+        if self._disconnected_at is not None:
+            self.reconnect_time.append(time.monotonic() - self._disconnected_at)
+            self._disconnected_at = None
+
+    def on_disconnect(self) -> None:
+        self.disconnects += 1
+        self._disconnected_at = time.monotonic()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Metrics snapshot for diagnostics."""
+
+        return {
+            "events": {
+                k: {"total": v.total, "rate": round(v.rate(), 2)}
+                for k, v in self.events.items()
+            },
+            "property_updates": dict(self.properties),
+            "state_writes": dict(self.writes),
+            "suppressed_writes": dict(self.suppressed),
+            "callback_latency_ms": _percentiles(self.latency),
+            "commands": dict(self.commands),
+            "dropped_commands": dict(self.dropped_commands),
+            "command_latency_ms": _percentiles(self.command_latency),
+            "phases_s": {k: round(v, 3) for k, v in self.phases.items()},
+            "advertisements": {
+                "received": self.advertisements,
+                "processed": self.advertisements_processed,
+            },
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "time_to_reconnect_s": [round(x, 3) for x in self.reconnect_time],
+        }
@@ -5,7 +5,15 @@ import dataclasses as dc
 from homeassistant.helpers.device_registry import DeviceInfo
 from pyftms import FitnessMachine
 
+from .analytics import DerivedMetrics, SummaryTracker
+from .connection import ConnectionManager
+from .control import CommandScheduler
 from .coordinator import DataCoordinator
+from .program import ProgramRunner
+from .replay import TraceRecorder
+from .session import SessionBuffer
+from .statistics import StatisticsImporter
+from .storage import Capabilities
 
 
 @dc.dataclass(frozen=True, kw_only=True)
@@ -16,5 +24,15 @@ class FtmsData:
     unique_id: str
     device_info: DeviceInfo
     ftms: FitnessMachine
+    capabilities: Capabilities
     coordinator: DataCoordinator
+    connection: ConnectionManager
+    session: SessionBuffer
+    summary: SummaryTracker
+    derived: DerivedMetrics | None
+    recorder: TraceRecorder
+    control: CommandScheduler
+    program: ProgramRunner
+    statistics: StatisticsImporter | None
     sensors: list[str]
+    max_update_rate: float
@@ -2,6 +2,7 @@
 
 import dataclasses as dc
 import logging
+from typing import Any
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -14,6 +15,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from pyftms.client import const as c
 
 from . import FtmsConfigEntry
+from .control import async_wait
 from .entity import FtmsEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,7 +63,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up a FTMS number entry."""
 
-    entities, ranges_ = [], entry.runtime_data.ftms.supported_ranges
+    entities, ranges_ = [], entry.runtime_data.capabilities.supported_ranges
 
     for desc in _ENTITIES:
         if range_ := ranges_.get(desc.key):
@@ -86,21 +88,36 @@ class FtmsNumberEntity(FtmsEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value from HA."""
 
-        await self.ftms.set_setting(self.key, value)
+        future = self._data.control.async_request(self.key, value)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        # Show the pending value and then the acknowledged one.
+        self.async_write_ha_state()
 
-        e, key = self.coordinator.data, self.key
+        try:
+            await async_wait(future)
 
-        if e.event_id == "update":
-            if (key := _NUMBERS_SENSORS_MAP.get(key)) is None:
-                return
+        finally:
+            self.async_write_ha_state()
 
-        elif e.event_id != "setup":
-            return
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        control = self._data.control
 
-        if (value := e.event_data.get(key)) is not None:
-            self._attr_native_value = value
-            self.async_write_ha_state()
+        return {
+            "pending_value": control.pending(self.key),
+            "acknowledged_value": control.acknowledged.get(self.key),
+        }
+
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        if (key := _NUMBERS_SENSORS_MAP.get(self.key)) is None:
+            return (self.key,)
+
+        return self.key, key
+
+    @callback
+    def _handle_coordinator_update(self, value: Any) -> None:
+        """Handle updated data from the coordinator."""
+
+        self._attr_native_value = value
+        self.async_schedule_write()
@@ -0,0 +1,101 @@
+"""Placement of the machine connections on Bluetooth adapters."""
+
+import asyncio
+import logging
+from collections import Counter
+from typing import Any
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+_MAX_CONNECTING_PER_ADAPTER = 2
+"""Limit of simultaneous connection attempts through one Bluetooth adapter."""
+_MIN_RSSI = -85
+"""Weaker signal is not acceptable if any adapter hears the machine better, dBm."""
+_MIGRATE_LOAD = 2
+"""Load difference making the machine move from its previous adapter."""
+
+
+class AdapterPlacement:
+    """
+    Assigns connections to the least-loaded adapters with acceptable signal.
+
+    Load is the number of connections of the integration placed on an adapter.
+    Signal is the RSSI of the last advertisement received by each adapter.
+    Machine is placed on its previous adapter unless the signal is lost or
+    other adapter is less loaded by `_MIGRATE_LOAD`. Placement is made on
+    connection only, so established links are never dropped for balancing.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._placed: dict[str, str] = {}
+        """Adapter sources of the connecting and connected machines."""
+        self._last: dict[str, str] = {}
+        """Last adapter sources of the machines."""
+
+    def slot(self, source: str) -> asyncio.Semaphore:
+        """Connection attempt slot of the adapter."""
+
+        if (slot := self._slots.get(source)) is None:
+            slot = self._slots[source] = asyncio.Semaphore(_MAX_CONNECTING_PER_ADAPTER)
+
+        return slot
+
+    @callback
+    def async_place(self, address: str) -> bluetooth.BluetoothScannerDevice | None:
+        """Choose and reserve the adapter for the connection. `None` if unseen."""
+
+        self.async_release(address)
+
+        if not (
+            devices := bluetooth.async_scanner_devices_by_address(
+                self._hass, address, connectable=True
+            )
+        ):
+            return None
+
+        load = Counter(self._placed.values())
+        good = [x for x in devices if x.advertisement.rssi >= _MIN_RSSI] or devices
+        best = min(good, key=lambda x: (load[x.scanner.source], -x.advertisement.rssi))
+
+        if (last := self._last.get(address)) != best.scanner.source:
+            for x in good:
+                if x.scanner.source == last:
+                    if load[last] - load[best.scanner.source] < _MIGRATE_LOAD:
+                        best = x
+
+                    break
+
+        source = best.scanner.source
+
+        if last is not None and source != last:
+            _LOGGER.debug(
+                "Connection of %s moves from %s to %s.", address, last, source
+            )
+
+        self._placed[address] = self._last[address] = source
+
+        return best
+
+    @callback
+    def async_release(self, address: str) -> None:
+        """Connection attempt failed or connection is lost."""
+        self._placed.pop(address, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Adapters load for diagnostics."""
+        return dict(Counter(self._placed.values()))
+
+
+@singleton(f"{DOMAIN}_placement")
+@callback
+def async_get_placement(hass: HomeAssistant) -> AdapterPlacement:
+    """Placement registry shared by all entries."""
+    return AdapterPlacement(hass)
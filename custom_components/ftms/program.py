@@ -0,0 +1,292 @@
+"""Structured workout programs executed by the integration."""
+
+import asyncio
+import dataclasses as dc
+import json
+import logging
+import math
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, callback
+from pyftms import FtmsEvents, SettingRange
+from pyftms.client import const as c
+
+from .control import CommandScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+PROGRAM_SUFFIXES = (".json", ".zwo")
+
+PROGRAM_TARGETS = (
+    c.TARGET_POWER,
+    c.TARGET_SPEED,
+    c.TARGET_INCLINATION,
+    c.TARGET_RESISTANCE,
+)
+
+_RAMP_INTERVAL = 1.0
+"""Interval of target updates during a ramp, seconds."""
+_EPSILON = 0.01
+"""Timer may fire a bit early. Tolerance of the step boundaries, seconds."""
+
+
+@dc.dataclass(frozen=True, kw_only=True)
+class ProgramStep:
+    """Step of a program. Targets are ramped linearly from start to end values."""
+
+    duration: float
+    targets: dict[str, tuple[float, float]]
+
+    @property
+    def is_ramp(self) -> bool:
+        return any(a != b for a, b in self.targets.values())
+
+
+def _finite(value: float) -> float:
+    if not math.isfinite(value):
+        raise vol.Invalid("Value must be finite")
+
+    return value
+
+
+_VALUE = vol.All(
+    vol.Any(int, float, msg="Value must be a number"), vol.Coerce(float), _finite
+)
+
+_TARGET = vol.Any(
+    None,
+    vol.All(_VALUE, lambda x: (x, x)),
+    vol.All(vol.ExactSequence([_VALUE, _VALUE]), vol.Coerce(tuple)),
+    msg="Target must be a number or a list of start and end values",
+)
+
+_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required("duration"): vol.All(_VALUE, vol.Range(min=0, min_included=False)),
+        **{vol.Optional(k): _TARGET for k in PROGRAM_TARGETS},
+    }
+)
+"""Step of JSON plan. Misspelled targets are rejected, not ignored."""
+
+_PLAN_SCHEMA = vol.Any(
+    vol.Schema({vol.Required("steps"): [_STEP_SCHEMA]}, extra=vol.ALLOW_EXTRA),
+    [_STEP_SCHEMA],
+)
+
+
+def _parse_json(text: str) -> list[ProgramStep]:
+    """
+    Steps of JSON plan. Each step has `duration` in seconds and target values.
+
+    Target is a number or a list of start and end values of a ramp:
+    `{"steps": [{"duration": 300, "target_power": [100, 200]}, ...]}`.
+    """
+
+    try:
+        data = _PLAN_SCHEMA(json.loads(text))
+
+    except vol.Invalid as exc:
+        raise ValueError(f"Invalid plan: {exc}") from exc
+
+    return [
+        ProgramStep(
+            duration=step["duration"],
+            targets={k: x for k in PROGRAM_TARGETS if (x := step.get(k)) is not None},
+        )
+        for step in (data["steps"] if isinstance(data, dict) else data)
+    ]
+
+
+def _parse_zwo(text: str, ftp: float) -> list[ProgramStep]:
+    """Steps of Zwift workout. Power is relative to functional threshold power."""
+
+    if (workout := ET.fromstring(text).find("workout")) is None:
+        raise ValueError("No workout element")
+
+    def number(x: ET.Element, attr: str, scale: float = 1) -> float:
+        # NaN target would break the runner timer, NaN duration its schedule.
+        if not math.isfinite(value := float(x.attrib[attr]) * scale):
+            raise ValueError(f"'{attr}' of '{x.tag}' must be finite")
+
+        return value
+
+    def power(x: ET.Element, attr: str) -> float:
+        return number(x, attr, ftp)
+
+    def step(x: ET.Element, attr: str, *watts: float) -> ProgramStep:
+        """Step of the duration attribute. Power of start and end, if any."""
+
+        if (duration := number(x, attr)) <= 0:
+            raise ValueError(f"'{attr}' of '{x.tag}' must be positive")
+
+        targets = {c.TARGET_POWER: watts} if watts else {}
+
+        return ProgramStep(duration=duration, targets=targets)
+
+    result = []
+
+    for x in workout:
+        match x.tag:
+            case "SteadyState":
+                p = power(x, "Power")
+                result.append(step(x, "Duration", p, p))
+
+            case "Warmup" | "Cooldown" | "Ramp":
+                low, high = power(x, "PowerLow"), power(x, "PowerHigh")
+                result.append(step(x, "Duration", low, high))
+
+            case "IntervalsT":
+                on, off = power(x, "OnPower"), power(x, "OffPower")
+
+                for _ in range(int(x.get("Repeat", 1))):
+                    result.append(step(x, "OnDuration", on, on))
+                    result.append(step(x, "OffDuration", off, off))
+
+            case "FreeRide" | "Freeride":
+                result.append(step(x, "Duration"))
+
+            case _:
+                _LOGGER.debug("Unsupported workout element '%s' is skipped.", x.tag)
+
+    return result
+
+
+def load_program(path: Path, ftp: float | None = None) -> list[ProgramStep]:
+    """
+    Load JSON or ZWO program. Blocking.
+
+    Raises `ValueError`, `KeyError` or `TypeError` if malformed.
+    """
+
+    text = path.read_text(encoding="utf-8")
+
+    if path.suffix == ".zwo":
+        if not ftp:
+            raise ValueError("FTP is required by ZWO workouts")
+
+        steps = _parse_zwo(text, ftp)
+
+    else:
+        steps = _parse_json(text)
+
+    if not steps:
+        raise ValueError("Program has no steps")
+
+    return steps
+
+
+class ProgramRunner:
+    """
+    Drives the target settings by the program steps.
+
+    Timer fires at step boundaries and every second of ramps. Fire times are
+    absolute offsets from the program start, so errors do not accumulate.
+    Targets are sent through the command scheduler and never queue up.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        control: CommandScheduler,
+        ranges: dict[str, SettingRange],
+    ) -> None:
+        self._hass = hass
+        self._control = control
+        self._ranges = ranges
+        self._steps: list[ProgramStep] = []
+        self._ends: list[float] = []
+        self._index = 0
+        self._start = 0.0
+        self._sent: dict[str, float] = {}
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._handle is not None
+
+    @callback
+    def async_start(self, steps: list[ProgramStep]) -> None:
+        """Start the program. Running one is stopped."""
+
+        self.async_stop()
+
+        ends, total = [], 0.0
+
+        for step in steps:
+            ends.append(total := total + step.duration)
+
+        self._steps, self._ends, self._index, self._sent = steps, ends, 0, {}
+        self._start = self._hass.loop.time()
+
+        _LOGGER.debug("Program of %d steps and %.0fs is started.", len(steps), total)
+
+        self._async_tick()
+
+    @callback
+    def async_stop(self) -> None:
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+            _LOGGER.debug("Program is stopped at step %d.", self._index + 1)
+
+    @callback
+    def async_on_event(self, e: FtmsEvents) -> None:
+        """Coordinator events listener. Machine stop ends the program."""
+
+        if e.event_id == "stop" or e.event_id == "reset":
+            self.async_stop()
+
+    def _quantize(self, key: str, value: float) -> float:
+        """Round the value to the step of the supported range."""
+
+        if (r := self._ranges.get(key)) is None:
+            return round(value, 1)
+
+        if r.step:
+            value = round(value / r.step) * r.step
+
+        return round(min(max(value, r.min_value), r.max_value), 3)
+
+    @callback
+    def _async_set(self, key: str, value: float) -> None:
+        if self._sent.get(key) == (value := self._quantize(key, value)):
+            return
+
+        self._sent[key] = value
+        self._control.async_request(key, value).add_done_callback(_log_failure)
+
+    @callback
+    def _async_tick(self) -> None:
+        elapsed = self._hass.loop.time() - self._start
+        ends, steps = self._ends, self._steps
+
+        while self._index < len(steps) and elapsed >= ends[self._index] - _EPSILON:
+            self._index += 1
+
+        if self._index == len(steps):
+            _LOGGER.debug("Program is completed.")
+            self._handle = None
+            return
+
+        step = steps[i := self._index]
+        begin = ends[i] - step.duration
+        progress = min(max(elapsed - begin, 0) / step.duration, 1)
+
+        for key, (a, b) in step.targets.items():
+            self._async_set(key, a + (b - a) * progress)
+
+        at = ends[i]
+
+        if step.is_ramp:
+            ticks = math.floor((elapsed - begin) / _RAMP_INTERVAL + _EPSILON) + 1
+            at = min(at, begin + ticks * _RAMP_INTERVAL)
+
+        self._handle = self._hass.loop.call_at(self._start + at, self._async_tick)
+
+
+def _log_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and (exc := future.exception()):
+        _LOGGER.warning("Program target write failed: %s", exc)
@@ -0,0 +1,373 @@
+"""
+Recording and replay of FTMS traces.
+
+Event traces are JSON lines of the coordinator events. Raw traces are binary
+logs of the training data notifications: magic header and records of relative
+time (float64), payload length (uint16) and payload bytes.
+"""
+
+import asyncio
+import dataclasses as dc
+import json
+import logging
+import struct
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from pyftms import (
+    ControlEvent,
+    FitnessMachine,
+    FtmsEvents,
+    SetupEvent,
+    UpdateEvent,
+)
+
+from .coordinator import DataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+TRACE_SUFFIX = ".jsonl"
+
+RAW_TRACE_MAGIC = b"FTMSTRC1"
+RAW_TRACE_SUFFIX = ".trc"
+
+type TraceRecord = tuple[float, FtmsEvents]
+"""Event and its time relative to the start of recording, seconds."""
+type RawTraceRecord = tuple[float, bytes]
+"""Notification payload and its time relative to the start of recording, seconds."""
+
+_RAW_RECORD = struct.Struct("<dH")
+
+_MAX_RECORDS = 262144
+"""Recording limit. About 18 hours of 4 Hz updates."""
+_YIELD_EVERY = 64
+"""Events replayed at full speed before yielding to the event loop."""
+
+_CONTROL_EVENTS = ("start", "stop", "pause", "reset")
+
+_PARSE_ERRORS = (AssertionError, EOFError, IndexError, KeyError, TypeError, ValueError)
+"""Errors of the client parser on malformed notifications."""
+
+
+def _default(x: Any) -> Any:
+    if isinstance(x, Enum):
+        return x.value
+
+    if dc.is_dataclass(x) and not isinstance(x, type):
+        return dc.asdict(x)
+
+    return str(x)
+
+
+def _encode(timestamp: float, e: FtmsEvents) -> str:
+    data: dict[str, Any] = {"time": round(timestamp, 3), "event_id": e.event_id}
+
+    if (x := getattr(e, "event_data", None)) is not None:
+        data["event_data"] = x
+
+    if (x := getattr(e, "event_source", None)) is not None:
+        data["event_source"] = x
+
+    return json.dumps(data, default=_default)
+
+
+def _decode(line: str) -> TraceRecord | None:
+    data = json.loads(line)
+    event_id, source = data["event_id"], data.get("event_source", "other")
+
+    if event_id == "update":
+        return data["time"], UpdateEvent(
+            event_id="update", event_data=data["event_data"]
+        )
+
+    if event_id == "setup":
+        return data["time"], SetupEvent(
+            event_id="setup", event_data=data["event_data"], event_source=source
+        )
+
+    if event_id in _CONTROL_EVENTS:
+        return data["time"], ControlEvent(event_id=event_id, event_source=source)
+
+    return None
+
+
+def write_trace(path: Path, records: Iterable[TraceRecord]) -> None:
+    """Write JSON lines trace. Blocking."""
+
+    path.parent.mkdir(exist_ok=True)
+
+    with path.open("w", encoding="utf-8") as f:
+        f.writelines(f"{_encode(*x)}\n" for x in records)
+
+
+def read_trace(path: Path) -> list[TraceRecord]:
+    """
+    Read JSON lines trace. Blocking.
+
+    Events the integration does not handle are skipped. Raises `ValueError`
+    or `KeyError` on malformed lines.
+    """
+
+    with path.open(encoding="utf-8") as f:
+        return [x for line in f if line.strip() and (x := _decode(line))]
+
+
+def write_raw_trace(path: Path, records: Iterable[RawTraceRecord]) -> None:
+    """Write binary raw trace. Blocking."""
+
+    path.parent.mkdir(exist_ok=True)
+
+    with path.open("wb") as f:
+        f.write(RAW_TRACE_MAGIC)
+        f.writelines(_RAW_RECORD.pack(t, len(x)) + x for t, x in records)
+
+
+def read_raw_trace(path: Path) -> list[RawTraceRecord]:
+    """Read binary raw trace. Blocking. Raises `ValueError` if malformed."""
+
+    buf, records = path.read_bytes(), []
+
+    if not buf.startswith(RAW_TRACE_MAGIC):
+        raise ValueError("Not a raw trace")
+
+    offset, size = len(RAW_TRACE_MAGIC), _RAW_RECORD.size
+
+    while offset < len(buf):
+        if offset + size > len(buf):
+            raise ValueError("Truncated record header")
+
+        t, n = _RAW_RECORD.unpack_from(buf, offset)
+
+        if (offset := offset + size) + n > len(buf):
+            raise ValueError("Truncated record payload")
+
+        records.append((t, buf[offset : offset + n]))
+        offset += n
+
+    return records
+
+
+def load_trace(path: Path) -> tuple[bool, list[Any]]:
+    """Read trace of any kind. Returns raw flag and records. Blocking."""
+
+    with path.open("rb") as f:
+        raw = f.read(len(RAW_TRACE_MAGIC)) == RAW_TRACE_MAGIC
+
+    return raw, read_raw_trace(path) if raw else read_trace(path)
+
+
+def _data_updater(ftms: FitnessMachine) -> Any | None:
+    """Training data notifications handler of the client. `None` if unknown."""
+
+    updater = getattr(ftms, "_updater", None)
+
+    if hasattr(updater, "_serializer") and hasattr(updater, "_on_notify"):
+        return updater
+
+    return None
+
+
+def raw_trace_supported(ftms: FitnessMachine) -> bool:
+    """Check that the client internals allow raw capture and replay."""
+    return _data_updater(ftms) is not None
+
+
+def raw_trace_feed(ftms: FitnessMachine) -> Callable[[bytes], None]:
+    """
+    Feed of raw notifications to the client parser, as if they were received.
+
+    Raises `ValueError` unless `raw_trace_supported`. The feed raises it on
+    malformed payloads.
+    """
+
+    if (updater := _data_updater(ftms)) is None:
+        raise ValueError("Client does not support raw traces")
+
+    def feed(data: bytes) -> None:
+        try:
+            updater._on_notify(None, bytearray(data))
+
+        except _PARSE_ERRORS as exc:
+            raise ValueError(f"Malformed notification: {data.hex(' ')}") from exc
+
+    return feed
+
+
+class _SerializerTap:
+    """
+    Proxy of the training data serializer passing the raw payloads to the sink.
+
+    The serializer is looked up on every notification, so it can be replaced
+    while connected. Notify callback is bound to the client at subscription.
+    """
+
+    __slots__ = ("_serializer", "_sink")
+
+    def __init__(self, serializer: Any, sink: Callable[[bytes], None]) -> None:
+        self._serializer = serializer
+        self._sink = sink
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._serializer, name)
+
+    def deserialize(self, data: bytearray) -> Any:
+        self._sink(bytes(data))
+        return self._serializer.deserialize(data)
+
+
+class TraceRecorder:
+    """Records the coordinator events or raw notifications in memory."""
+
+    def __init__(self, coordinator: DataCoordinator, ftms: FitnessMachine) -> None:
+        self._coordinator = coordinator
+        self._ftms = ftms
+        self._records: list[Any] = []
+        self._start = 0.0
+        self._unsub: CALLBACK_TYPE | None = None
+        self.raw = False
+        self.start_time: float | None = None
+        """UNIX timestamp of the recording start."""
+
+    @property
+    def recording(self) -> bool:
+        return self._unsub is not None
+
+    @callback
+    def async_start(self, raw: bool = False) -> None:
+        """
+        Start new recording. Running one is discarded.
+
+        Raw recording requires `raw_trace_supported` client, `ValueError` is
+        raised otherwise.
+        """
+
+        self.async_stop()
+
+        self._records, self.raw = [], raw
+        self._start, self.start_time = time.monotonic(), time.time()
+
+        if not raw:
+            self._unsub = self._coordinator.async_add_event_listener(
+                self._append, live=True
+            )
+            return
+
+        if (updater := _data_updater(self._ftms)) is None:
+            raise ValueError("Client does not support raw traces")
+
+        tap = updater._serializer = _SerializerTap(updater._serializer, self._append)
+
+        @callback
+        def remove_tap() -> None:
+            updater._serializer = tap._serializer
+
+        self._unsub = remove_tap
+
+    @callback
+    def async_stop(self) -> list[Any]:
+        """Stop recording and return the records."""
+
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+        records, self._records = self._records, []
+
+        return records
+
+    @callback
+    def _append(self, x: FtmsEvents | bytes) -> None:
+        # Records are immutable, so encoding is deferred to writing.
+        if (n := len(self._records)) < _MAX_RECORDS:
+            self._records.append((time.monotonic() - self._start, x))
+
+            if n + 1 == _MAX_RECORDS:
+                _LOGGER.warning(
+                    "Trace recording limit is reached. Next events are dropped."
+                )
+
+
+async def async_replay[T](
+    coordinator: DataCoordinator,
+    records: list[tuple[float, T]],
+    feed: Callable[[T], None],
+    speed: float = 0,
+    trace_memory: bool = False,
+    live: bool = False,
+) -> dict[str, Any]:
+    """
+    Feed recorded events or raw notifications as if they were received.
+
+    With zero `speed` records are replayed as fast as possible. Otherwise, the
+    recorded timing is kept, accelerated by `speed` times. Returns throughput
+    and cost of the processing.
+
+    Listeners of the real workout are detached, so replayed events do not
+    reach the session, summary, statistics, program and idle tracking. With
+    `live`, events are handled as the workout of a stand-in machine.
+    """
+
+    metrics, loop = coordinator.metrics, asyncio.get_running_loop()
+    writes = metrics.writes.total()
+
+    started = False
+
+    if trace_memory:
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+
+        else:
+            tracemalloc.start()
+            started = True
+
+    if not live:
+        coordinator.async_set_replaying(True)
+
+    cpu, start = time.process_time(), loop.time()
+
+    try:
+        for n, (timestamp, x) in enumerate(records):
+            if speed:
+                if (delay := start + timestamp / speed - loop.time()) > 0:
+                    await asyncio.sleep(delay)
+
+            elif n % _YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+            feed(x)
+
+        # Let the writes scheduled by the last events complete.
+        await asyncio.sleep(0)
+
+        elapsed, cpu = loop.time() - start, time.process_time() - cpu
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+
+    finally:
+        if not live:
+            coordinator.async_set_replaying(False)
+
+        # Tracing slows down all allocations, so it must not outlive a failure.
+        if started:
+            tracemalloc.stop()
+
+    events, writes = len(records), metrics.writes.total() - writes
+
+    result: dict[str, Any] = {
+        "events": events,
+        "duration_s": round(elapsed, 3),
+        "events_per_second": round(events / elapsed, 1) if elapsed else None,
+        "writes_per_second": round(writes / elapsed, 1) if elapsed else None,
+        "cpu_per_event_us": round(cpu / events * 1e6, 1) if events else None,
+    }
+
+    if trace_memory:
+        result["peak_memory_kb"] = round(peak / 1024)
+
+    _LOGGER.debug("Trace replay result: %s", result)
+
+    return result
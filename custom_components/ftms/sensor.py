@@ -1,9 +1,19 @@
 """FTMS integration sensor platform."""
 
+import dataclasses as dc
 import logging
+import sys
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime
 from enum import Enum
+from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorEntity,
+    SensorEntityDescription,
+)
 from homeassistant.components.sensor.const import SensorDeviceClass, SensorStateClass
 from homeassistant.const import (
     UnitOfEnergy,
@@ -12,231 +22,281 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from pyftms import MovementDirection, TrainingStatusCode
 from pyftms.client import const as c
 
 from . import FtmsConfigEntry
+from . import analytics as a
 from .entity import FtmsEntity
+from .statistics import STATISTICS_TOTALS
 
 _LOGGER = logging.getLogger(__name__)
 
-_CADENCE_AVERAGE = SensorEntityDescription(
+
+@dc.dataclass(frozen=True, kw_only=True)
+class FtmsSensorEntityDescription(SensorEntityDescription):
+    """FTMS sensor entity description."""
+
+    abs_tol: float = 0
+    """Absolute deadband. Smaller changes are not written to the state machine."""
+
+    rel_tol: float = 0
+    """Relative deadband. Fraction of the last written value."""
+
+    rate_limited: bool = False
+    """High-rate sensor. State writes are limited by `max_update_rate` option."""
+
+    converter: Callable[[Any], Any] | None = None
+    """Converter of the property value to the native value. `None` - identity."""
+
+    option_map: Mapping[Any, str] | None = None
+    """Option strings of the enum property values. Looked up as the converter."""
+
+    initial: Any = 0
+    """Native value until the first update. `None` - unknown."""
+
+
+def _enum_options(enum: type[Enum]) -> dict[Any, str]:
+    """Precomputed option strings of the members. Integer values are found too."""
+    return {x: sys.intern(x.name.lower()) for x in enum}
+
+
+_CADENCE_AVERAGE = FtmsSensorEntityDescription(
     key=c.CADENCE_AVERAGE,
     native_unit_of_measurement="rpm",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_CADENCE_INSTANT = SensorEntityDescription(
+_CADENCE_INSTANT = FtmsSensorEntityDescription(
     key=c.CADENCE_INSTANT,
     native_unit_of_measurement="rpm",
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_DISTANCE_TOTAL = SensorEntityDescription(
+_DISTANCE_TOTAL = FtmsSensorEntityDescription(
     key=c.DISTANCE_TOTAL,
     device_class=SensorDeviceClass.DISTANCE,
     native_unit_of_measurement=UnitOfLength.METERS,
     state_class=SensorStateClass.TOTAL,
 )
 
-_ELEVATION_GAIN_NEGATIVE = SensorEntityDescription(
+_ELEVATION_GAIN_NEGATIVE = FtmsSensorEntityDescription(
     key=c.ELEVATION_GAIN_NEGATIVE,
     device_class=SensorDeviceClass.DISTANCE,
     native_unit_of_measurement=UnitOfLength.METERS,
     state_class=SensorStateClass.TOTAL,
 )
 
-_ELEVATION_GAIN_POSITIVE = SensorEntityDescription(
+_ELEVATION_GAIN_POSITIVE = FtmsSensorEntityDescription(
     key=c.ELEVATION_GAIN_POSITIVE,
     device_class=SensorDeviceClass.DISTANCE,
     native_unit_of_measurement=UnitOfLength.METERS,
     state_class=SensorStateClass.TOTAL,
 )
 
-_ENERGY_PER_HOUR = SensorEntityDescription(
+_ENERGY_PER_HOUR = FtmsSensorEntityDescription(
     key=c.ENERGY_PER_HOUR,
     device_class=SensorDeviceClass.ENERGY,
     native_unit_of_measurement=UnitOfEnergy.KILO_CALORIE,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_ENERGY_PER_MINUTE = SensorEntityDescription(
+_ENERGY_PER_MINUTE = FtmsSensorEntityDescription(
     key=c.ENERGY_PER_MINUTE,
     device_class=SensorDeviceClass.ENERGY,
     native_unit_of_measurement=UnitOfEnergy.KILO_CALORIE,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_ENERGY_TOTAL = SensorEntityDescription(
+_ENERGY_TOTAL = FtmsSensorEntityDescription(
     key=c.ENERGY_TOTAL,
     device_class=SensorDeviceClass.ENERGY,
     native_unit_of_measurement=UnitOfEnergy.KILO_CALORIE,
     state_class=SensorStateClass.TOTAL,
 )
 
-_FORCE_ON_BELT = SensorEntityDescription(
+_FORCE_ON_BELT = FtmsSensorEntityDescription(
     key=c.FORCE_ON_BELT,
     native_unit_of_measurement="N",
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_HEART_RATE = SensorEntityDescription(
+_HEART_RATE = FtmsSensorEntityDescription(
     key=c.HEART_RATE,
     native_unit_of_measurement="bpm",
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_INCLINATION = SensorEntityDescription(
+_INCLINATION = FtmsSensorEntityDescription(
     key=c.INCLINATION,
     native_unit_of_measurement="%",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_METABOLIC_EQUIVALENT = SensorEntityDescription(
+_METABOLIC_EQUIVALENT = FtmsSensorEntityDescription(
     key=c.METABOLIC_EQUIVALENT,
     native_unit_of_measurement="MET",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_MOVEMENT_DIRECTION = SensorEntityDescription(
+_MOVEMENT_DIRECTION = FtmsSensorEntityDescription(
     key=c.MOVEMENT_DIRECTION,
     device_class=SensorDeviceClass.ENUM,
     options=[x.name.lower() for x in MovementDirection],
+    option_map=_enum_options(MovementDirection),
+    initial=None,
 )
 
-_PACE_AVERAGE = SensorEntityDescription(
+_PACE_AVERAGE = FtmsSensorEntityDescription(
     key=c.PACE_AVERAGE,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.MINUTES,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_PACE_INSTANT = SensorEntityDescription(
+_PACE_INSTANT = FtmsSensorEntityDescription(
     key=c.PACE_INSTANT,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.MINUTES,
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_POWER_AVERAGE = SensorEntityDescription(
+_POWER_AVERAGE = FtmsSensorEntityDescription(
     key=c.POWER_AVERAGE,
     device_class=SensorDeviceClass.POWER,
     native_unit_of_measurement=UnitOfPower.WATT,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_POWER_INSTANT = SensorEntityDescription(
+_POWER_INSTANT = FtmsSensorEntityDescription(
     key=c.POWER_INSTANT,
     device_class=SensorDeviceClass.POWER,
     native_unit_of_measurement=UnitOfPower.WATT,
     state_class=SensorStateClass.MEASUREMENT,
+    rel_tol=0.01,
+    rate_limited=True,
 )
 
-_POWER_OUTPUT = SensorEntityDescription(
+_POWER_OUTPUT = FtmsSensorEntityDescription(
     key=c.POWER_OUTPUT,
     device_class=SensorDeviceClass.POWER,
     native_unit_of_measurement=UnitOfPower.WATT,
     state_class=SensorStateClass.MEASUREMENT,
+    rel_tol=0.01,
+    rate_limited=True,
 )
 
-_RAMP_ANGLE = SensorEntityDescription(
+_RAMP_ANGLE = FtmsSensorEntityDescription(
     key=c.RAMP_ANGLE,
     native_unit_of_measurement="°",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_RESISTANCE_LEVEL = SensorEntityDescription(
+_RESISTANCE_LEVEL = FtmsSensorEntityDescription(
     key=c.RESISTANCE_LEVEL,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_SPEED_AVERAGE = SensorEntityDescription(
+_SPEED_AVERAGE = FtmsSensorEntityDescription(
     key=c.SPEED_AVERAGE,
     device_class=SensorDeviceClass.SPEED,
     native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
     state_class=SensorStateClass.MEASUREMENT,
+    abs_tol=0.1,
 )
 
-_SPEED_INSTANT = SensorEntityDescription(
+_SPEED_INSTANT = FtmsSensorEntityDescription(
     key=c.SPEED_INSTANT,
     device_class=SensorDeviceClass.SPEED,
     native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
     state_class=SensorStateClass.MEASUREMENT,
+    abs_tol=0.1,
+    rate_limited=True,
 )
 
-_SPLIT_TIME_AVERAGE = SensorEntityDescription(
+_SPLIT_TIME_AVERAGE = FtmsSensorEntityDescription(
     key=c.SPLIT_TIME_AVERAGE,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.SECONDS,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_SPLIT_TIME_INSTANT = SensorEntityDescription(
+_SPLIT_TIME_INSTANT = FtmsSensorEntityDescription(
     key=c.SPLIT_TIME_INSTANT,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.SECONDS,
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_STEP_COUNT = SensorEntityDescription(
+_STEP_COUNT = FtmsSensorEntityDescription(
     key=c.STEP_COUNT,
     state_class=SensorStateClass.TOTAL,
 )
 
-_STEP_RATE_AVERAGE = SensorEntityDescription(
+_STEP_RATE_AVERAGE = FtmsSensorEntityDescription(
     key=c.STEP_RATE_AVERAGE,
     native_unit_of_measurement="min⁻¹",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_STEP_RATE_INSTANT = SensorEntityDescription(
+_STEP_RATE_INSTANT = FtmsSensorEntityDescription(
     key=c.STEP_RATE_INSTANT,
     native_unit_of_measurement="min⁻¹",
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_STRIDE_COUNT = SensorEntityDescription(
+_STRIDE_COUNT = FtmsSensorEntityDescription(
     key=c.STRIDE_COUNT,
     state_class=SensorStateClass.TOTAL,
 )
 
-_STROKE_COUNT = SensorEntityDescription(
+_STROKE_COUNT = FtmsSensorEntityDescription(
     key=c.STROKE_COUNT,
     state_class=SensorStateClass.TOTAL,
 )
 
-_STROKE_RATE_AVERAGE = SensorEntityDescription(
+_STROKE_RATE_AVERAGE = FtmsSensorEntityDescription(
     key=c.STROKE_RATE_AVERAGE,
     native_unit_of_measurement="min⁻¹",
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_STROKE_RATE_INSTANT = SensorEntityDescription(
+_STROKE_RATE_INSTANT = FtmsSensorEntityDescription(
     key=c.STROKE_RATE_INSTANT,
     native_unit_of_measurement="min⁻¹",
     state_class=SensorStateClass.MEASUREMENT,
+    rate_limited=True,
 )
 
-_TIME_ELAPSED = SensorEntityDescription(
+_TIME_ELAPSED = FtmsSensorEntityDescription(
     key=c.TIME_ELAPSED,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.SECONDS,
     state_class=SensorStateClass.TOTAL,
 )
 
-_TIME_REMAINING = SensorEntityDescription(
+_TIME_REMAINING = FtmsSensorEntityDescription(
     key=c.TIME_REMAINING,
     device_class=SensorDeviceClass.DURATION,
     native_unit_of_measurement=UnitOfTime.SECONDS,
     state_class=SensorStateClass.MEASUREMENT,
 )
 
-_TRAINING_STATUS = SensorEntityDescription(
+_TRAINING_STATUS = FtmsSensorEntityDescription(
     key=c.TRAINING_STATUS,
     device_class=SensorDeviceClass.ENUM,
     options=[x.name.lower() for x in TrainingStatusCode],
+    option_map=_enum_options(TrainingStatusCode),
+    initial=None,
 )
 
 _ENTITIES = {
@@ -276,6 +336,140 @@ _ENTITIES = {
     c.TRAINING_STATUS: _TRAINING_STATUS,
 }
 
+_SESSION_ENTITIES = {
+    a.DURATION: (
+        None,
+        FtmsSensorEntityDescription(
+            key=a.DURATION,
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+        ),
+    ),
+    a.MOVING_TIME: (
+        None,
+        FtmsSensorEntityDescription(
+            key=a.MOVING_TIME,
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+        ),
+    ),
+    a.POWER_AVERAGE: (
+        c.POWER_INSTANT,
+        FtmsSensorEntityDescription(
+            key=a.POWER_AVERAGE,
+            device_class=SensorDeviceClass.POWER,
+            native_unit_of_measurement=UnitOfPower.WATT,
+        ),
+    ),
+    a.POWER_MAX: (
+        c.POWER_INSTANT,
+        FtmsSensorEntityDescription(
+            key=a.POWER_MAX,
+            device_class=SensorDeviceClass.POWER,
+            native_unit_of_measurement=UnitOfPower.WATT,
+        ),
+    ),
+    a.POWER_NORMALIZED: (
+        c.POWER_INSTANT,
+        FtmsSensorEntityDescription(
+            key=a.POWER_NORMALIZED,
+            device_class=SensorDeviceClass.POWER,
+            native_unit_of_measurement=UnitOfPower.WATT,
+        ),
+    ),
+    a.CADENCE_AVERAGE: (
+        c.CADENCE_INSTANT,
+        FtmsSensorEntityDescription(
+            key=a.CADENCE_AVERAGE,
+            native_unit_of_measurement="rpm",
+        ),
+    ),
+    a.SPEED_MAX: (
+        c.SPEED_INSTANT,
+        FtmsSensorEntityDescription(
+            key=a.SPEED_MAX,
+            device_class=SensorDeviceClass.SPEED,
+            native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        ),
+    ),
+    a.ENERGY_TOTAL: (
+        None,
+        FtmsSensorEntityDescription(
+            key=a.ENERGY_TOTAL,
+            device_class=SensorDeviceClass.ENERGY,
+            native_unit_of_measurement=UnitOfEnergy.KILO_CALORIE,
+        ),
+    ),
+} | {
+    zone: (
+        c.HEART_RATE,
+        FtmsSensorEntityDescription(
+            key=zone,
+            device_class=SensorDeviceClass.DURATION,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+        ),
+    )
+    for zone in a.HEART_RATE_ZONES
+}
+"""Session summary sensors and the properties they require."""
+
+_DERIVED_ENTITIES = {
+    a.POWER_3S: FtmsSensorEntityDescription(
+        key=a.POWER_3S,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        rel_tol=0.01,
+        initial=None,
+    ),
+    a.POWER_30S: FtmsSensorEntityDescription(
+        key=a.POWER_30S,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        rel_tol=0.01,
+        initial=None,
+    ),
+    a.POWER_NORMALIZED: FtmsSensorEntityDescription(
+        key=a.POWER_NORMALIZED,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        rel_tol=0.01,
+        initial=None,
+    ),
+    a.POWER_TO_WEIGHT: FtmsSensorEntityDescription(
+        key=a.POWER_TO_WEIGHT,
+        native_unit_of_measurement="W/kg",
+        state_class=SensorStateClass.MEASUREMENT,
+        abs_tol=0.01,
+        initial=None,
+    ),
+    a.POWER_ROLLING: FtmsSensorEntityDescription(
+        key=a.POWER_ROLLING,
+        device_class=SensorDeviceClass.POWER,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        rel_tol=0.01,
+        initial=None,
+    ),
+    a.SPEED_ROLLING: FtmsSensorEntityDescription(
+        key=a.SPEED_ROLLING,
+        device_class=SensorDeviceClass.SPEED,
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        state_class=SensorStateClass.MEASUREMENT,
+        abs_tol=0.1,
+        initial=None,
+    ),
+    a.CADENCE_ROLLING: FtmsSensorEntityDescription(
+        key=a.CADENCE_ROLLING,
+        native_unit_of_measurement="rpm",
+        state_class=SensorStateClass.MEASUREMENT,
+        initial=None,
+    ),
+}
+"""Sensors of the metrics derived by the integration. Unknown until computed."""
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -286,13 +480,33 @@ async def async_setup_entry(
 
     data = entry.runtime_data
 
-    entities = [
-        FtmsSensorEntity(
-            entry=entry,
-            description=_ENTITIES[key],
+    entities = []
+
+    for key in data.sensors:
+        description = _ENTITIES[key]
+
+        # Imported statistics replace the ones of the high-rate states.
+        if (stats := data.statistics) is not None and (
+            description.rate_limited or key in STATISTICS_TOTALS
+        ):
+            stats.async_register(key, description.native_unit_of_measurement)
+            description = dc.replace(description, state_class=None)
+
+        entities.append(FtmsSensorEntity(entry=entry, description=description))
+
+    properties = data.capabilities.available_properties
+
+    entities.extend(
+        FtmsSessionSensorEntity(entry=entry, description=description)
+        for source, description in _SESSION_ENTITIES.values()
+        if source is None or source in properties
+    )
+
+    if data.derived is not None:
+        entities.extend(
+            FtmsSensorEntity(entry=entry, description=_DERIVED_ENTITIES[key])
+            for key in data.derived.as_dict()
         )
-        for key in data.sensors
-    ]
 
     async_add_entities(entities)
 
@@ -300,26 +514,127 @@ async def async_setup_entry(
 class FtmsSensorEntity(FtmsEntity, SensorEntity):
     """Representation of FTMS sensors."""
 
+    entity_description: FtmsSensorEntityDescription
+
+    _convert: Callable[[Any], Any] | None
+    _interval: float
+    """Minimal interval between state writes. `0` - unlimited."""
+    _last_write: float = 0
+    _unsub_flush: CALLBACK_TYPE | None = None
+    _deferred_time: float = 0
+    """Monotonic time of the event deferred to the trailing write."""
+
     def __init__(self, entry, description) -> None:
         super().__init__(entry, description)
 
+        rate = self._data.max_update_rate if description.rate_limited else 0
+        self._interval = 1 / rate if rate else 0
+        self._convert = description.converter
+
+        if description.option_map is not None:
+            self._convert = description.option_map.get
+
+        # Entities are created before the connection, from stored capabilities.
         if (x := self.ftms.get_property(self.key)) is None:
-            x = 0
+            x = description.initial
 
-        elif isinstance(x, Enum):
-            x = x.name.lower()
+        elif self._convert is not None:
+            x = self._convert(x)
 
         self._attr_native_value = x
 
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        return (self.key,)
+
+    def _is_insignificant(self, value: Any) -> bool:
+        """Check that the value is within the deadband of the last written one."""
+
+        if value == (last := self._attr_native_value):
+            return True
+
+        desc = self.entity_description
+
+        # Always write transitions from and to zero (start and stop of training).
+        if not (desc.abs_tol or desc.rel_tol) or not value or not last:
+            return False
+
+        return abs(value - last) <= max(desc.abs_tol, desc.rel_tol * abs(last))
+
     @callback
-    def _handle_coordinator_update(self) -> None:
+    def _handle_coordinator_update(self, value: Any) -> None:
         """Handle updated data from the coordinator."""
 
-        e = self.coordinator.data
+        if self._convert is not None:
+            value = self._convert(value)
+
+        if self._is_insignificant(value):
+            self.coordinator.metrics.on_suppressed(self.entity_id)
+            return
+
+        self._attr_native_value = value
+
+        # Trailing write is already scheduled. It will publish the latest value.
+        if self._unsub_flush:
+            self.coordinator.metrics.on_suppressed(self.entity_id)
+            return
+
+        if (delay := self._last_write + self._interval - time.monotonic()) > 0:
+            self._deferred_time = self.coordinator.event_time
+            self._unsub_flush = async_call_later(self.hass, delay, self._async_flush)
+            return
+
+        self._async_publish()
+
+    @callback
+    def _async_flush(self, now: datetime) -> None:
+        """Trailing edge write of the throttled value."""
+
+        self._unsub_flush = None
+        self._async_publish(self._deferred_time)
+
+    @callback
+    def _async_publish(self, event_time: float | None = None) -> None:
+        self._last_write = time.monotonic()
+        self.async_schedule_write(event_time)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending trailing write."""
 
-        if e.event_id == "update" and (value := e.event_data.get(self.key)) is not None:
-            if isinstance(value, Enum):
-                value = value.name.lower()
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
 
-            self._attr_native_value = value
-            self.async_write_ha_state()
+        await super().async_will_remove_from_hass()
+
+
+class FtmsSessionSensorEntity(FtmsEntity, RestoreSensor):
+    """Session summary sensor. Updated at the end of workout."""
+
+    def __init__(self, entry, description) -> None:
+        super().__init__(entry, description)
+
+        self._attr_unique_id = f"{self._data.unique_id}-{a.SESSION_PREFIX}{self.key}"
+        self._attr_translation_key = f"{a.SESSION_PREFIX}{self.key}"
+
+    @property
+    def listen_keys(self) -> tuple[str, ...]:
+        return (a.SESSION_SUMMARY,)
+
+    @property
+    def available(self) -> bool:
+        """Summary of the last workout is kept while the machine is off."""
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the summary of the last workout."""
+
+        await super().async_added_to_hass()
+
+        if (last := await self.async_get_last_sensor_data()) is not None:
+            self._attr_native_value = last.native_value
+
+    @callback
+    def _handle_coordinator_update(self, value: dict[str, Any]) -> None:
+        self._attr_native_value = value[self.key]
+        self.async_schedule_write()
@@ -0,0 +1,396 @@
+"""Services of the FTMS integration."""
+
+import datetime as dt
+import logging
+from pathlib import Path
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+
+from .const import DOMAIN
+from .export import EXPORT_FORMATS, write_session
+from .models import FtmsData
+from .program import PROGRAM_SUFFIXES, PROGRAM_TARGETS, load_program
+from .replay import (
+    RAW_TRACE_SUFFIX,
+    TRACE_SUFFIX,
+    async_replay,
+    load_trace,
+    raw_trace_feed,
+    raw_trace_supported,
+    write_raw_trace,
+    write_trace,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_EXPORT_SESSION = "export_session"
+SERVICE_START_RECORDING = "start_recording"
+SERVICE_STOP_RECORDING = "stop_recording"
+SERVICE_REPLAY_TRACE = "replay_trace"
+SERVICE_START_PROGRAM = "start_program"
+SERVICE_STOP_PROGRAM = "stop_program"
+
+ATTR_FILENAME = "filename"
+ATTR_FORMAT = "format"
+ATTR_FTP = "ftp"
+ATTR_RAW = "raw"
+ATTR_SPEED = "speed"
+ATTR_TRACE_MEMORY = "trace_memory"
+
+_FILENAME = vol.All(cv.string, vol.Match(r"^(?!\.+$)[\w\-. ]+$"))
+"""File name in the integration folder. Names of dots only are path references."""
+
+EXPORT_SESSION_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_FORMAT, default="fit"): vol.In(EXPORT_FORMATS),
+        vol.Optional(ATTR_FILENAME): _FILENAME,
+    }
+)
+
+START_RECORDING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_RAW, default=False): cv.boolean,
+    }
+)
+
+STOP_RECORDING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Optional(ATTR_FILENAME): _FILENAME,
+    }
+)
+
+REPLAY_TRACE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_FILENAME): _FILENAME,
+        vol.Required(ATTR_SPEED, default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Required(ATTR_TRACE_MEMORY, default=False): cv.boolean,
+    }
+)
+
+START_PROGRAM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+        vol.Required(ATTR_FILENAME): _FILENAME,
+        vol.Optional(ATTR_FTP): vol.All(vol.Coerce(float), vol.Range(min=50, max=600)),
+    }
+)
+
+STOP_PROGRAM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): cv.string,
+    }
+)
+
+
+def _path(hass: HomeAssistant, filename: str, suffix: str) -> Path:
+    """
+    File path in the integration folder of the configuration directory.
+
+    Suffix is appended unless present, so dots in names are kept.
+    """
+
+    if not filename.endswith(suffix):
+        filename += suffix
+
+    return Path(hass.config.path(DOMAIN), filename)
+
+
+def _default_filename(data: FtmsData, start: float) -> str:
+    return f"{data.unique_id}_{dt.datetime.fromtimestamp(start):%Y%m%d_%H%M%S}"
+
+
+@callback
+def _async_get_data(hass: HomeAssistant, device_id: str) -> FtmsData:
+    """Runtime data of the loaded entry of the device."""
+
+    if device := dr.async_get(hass).async_get(device_id):
+        for entry_id in device.config_entries:
+            entry = hass.config_entries.async_get_entry(entry_id)
+
+            if (
+                entry
+                and entry.domain == DOMAIN
+                and entry.state is ConfigEntryState.LOADED
+            ):
+                return entry.runtime_data
+
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="device_not_loaded",
+    )
+
+
+async def _async_export_session(call: ServiceCall) -> ServiceResponse:
+    """Export current or last workout session to the file."""
+
+    hass, fmt = call.hass, call.data[ATTR_FORMAT]
+    data = _async_get_data(hass, call.data[ATTR_DEVICE_ID])
+
+    # Arrays copy is cheap and makes the file writer independent of new samples.
+    session = data.session.copy()
+
+    if (start := session.start_time) is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="session_empty",
+        )
+
+    if not (filename := call.data.get(ATTR_FILENAME)):
+        filename = _default_filename(data, start)
+
+    path = _path(hass, filename, f".{fmt}")
+
+    def _write() -> None:
+        path.parent.mkdir(exist_ok=True)
+
+        with path.open("wb") as f:
+            write_session(f, session, fmt, data.capabilities.machine_type)
+
+    await hass.async_add_executor_job(_write)
+
+    _LOGGER.debug("Session of %d samples is exported to '%s'.", len(session), path)
+
+    return {"path": str(path), "samples": len(session)}
+
+
+@callback
+def _async_check_raw_supported(data: FtmsData) -> None:
+    if not raw_trace_supported(data.ftms):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="raw_trace_unsupported",
+        )
+
+
+async def _async_start_recording(call: ServiceCall) -> None:
+    """Start recording of the events stream or raw notifications of the machine."""
+
+    data = _async_get_data(call.hass, call.data[ATTR_DEVICE_ID])
+
+    if raw := call.data[ATTR_RAW]:
+        _async_check_raw_supported(data)
+
+    data.recorder.async_start(raw)
+
+
+async def _async_stop_recording(call: ServiceCall) -> ServiceResponse:
+    """Stop recording and save the trace to the file."""
+
+    hass = call.hass
+    data = _async_get_data(hass, call.data[ATTR_DEVICE_ID])
+    recorder = data.recorder
+
+    if not recorder.recording or (start := recorder.start_time) is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="not_recording",
+        )
+
+    records = recorder.async_stop()
+
+    filename = call.data.get(ATTR_FILENAME) or _default_filename(data, start)
+
+    if recorder.raw:
+        path = _path(hass, filename, RAW_TRACE_SUFFIX)
+        await hass.async_add_executor_job(write_raw_trace, path, records)
+
+    else:
+        path = _path(hass, filename, TRACE_SUFFIX)
+        await hass.async_add_executor_job(write_trace, path, records)
+
+    _LOGGER.debug("Trace of %d records is saved to '%s'.", len(records), path)
+
+    return {"path": str(path), "events": len(records)}
+
+
+async def _async_replay_trace(call: ServiceCall) -> ServiceResponse:
+    """Replay the recorded trace through the integration without the machine."""
+
+    hass = call.hass
+    data = _async_get_data(hass, call.data[ATTR_DEVICE_ID])
+
+    # Real notifications would be mixed with the replayed ones.
+    if data.ftms.is_connected:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="device_connected",
+        )
+
+    filename = call.data[ATTR_FILENAME]
+
+    if (suffix := Path(filename).suffix) not in (TRACE_SUFFIX, RAW_TRACE_SUFFIX):
+        suffix = TRACE_SUFFIX
+
+    path = _path(hass, filename, suffix)
+
+    try:
+        raw, records = await hass.async_add_executor_job(load_trace, path)
+
+    except FileNotFoundError as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="file_not_found",
+            translation_placeholders={"path": str(path)},
+        ) from exc
+
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="trace_invalid",
+            translation_placeholders={"path": str(path)},
+        ) from exc
+
+    # Raw notifications are decoded by the client, so parsing cost is included.
+    if raw:
+        _async_check_raw_supported(data)
+        feed = raw_trace_feed(data.ftms)
+
+    else:
+        feed = data.coordinator.async_handle_event
+
+    try:
+        result = await async_replay(
+            data.coordinator,
+            records,
+            feed,
+            call.data[ATTR_SPEED],
+            call.data[ATTR_TRACE_MEMORY],
+        )
+
+    except ValueError as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="trace_invalid",
+            translation_placeholders={"path": str(path)},
+        ) from exc
+
+    return result | {"raw": raw}
+
+
+async def _async_start_program(call: ServiceCall) -> ServiceResponse:
+    """Load the workout program from the file and start driving the targets."""
+
+    hass = call.hass
+    data = _async_get_data(hass, call.data[ATTR_DEVICE_ID])
+    filename, ftp = call.data[ATTR_FILENAME], call.data.get(ATTR_FTP)
+
+    if (suffix := Path(filename).suffix) not in PROGRAM_SUFFIXES:
+        suffix = PROGRAM_SUFFIXES[0]
+
+    if suffix == ".zwo" and not ftp:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="ftp_required",
+        )
+
+    path = _path(hass, filename, suffix)
+
+    try:
+        steps = await hass.async_add_executor_job(load_program, path, ftp)
+
+    except FileNotFoundError as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="file_not_found",
+            translation_placeholders={"path": str(path)},
+        ) from exc
+
+    except (KeyError, TypeError, ValueError, SyntaxError) as exc:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="program_invalid",
+            translation_placeholders={"path": str(path)},
+        ) from exc
+
+    targets = {k for x in steps for k in x.targets}
+
+    if unsupported := targets - set(data.capabilities.supported_ranges):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="program_unsupported",
+            translation_placeholders={"targets": ", ".join(sorted(unsupported))},
+        )
+
+    data.program.async_start(steps)
+
+    return {
+        "steps": len(steps),
+        "duration": round(sum(x.duration for x in steps)),
+        "targets": [x for x in PROGRAM_TARGETS if x in targets],
+    }
+
+
+async def _async_stop_program(call: ServiceCall) -> None:
+    """Stop the running workout program. Targets keep the last values."""
+
+    data = _async_get_data(call.hass, call.data[ATTR_DEVICE_ID])
+    data.program.async_stop()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register integration services."""
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT_SESSION,
+        _async_export_session,
+        schema=EXPORT_SESSION_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_RECORDING,
+        _async_start_recording,
+        schema=START_RECORDING_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_RECORDING,
+        _async_stop_recording,
+        schema=STOP_RECORDING_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_TRACE,
+        _async_replay_trace,
+        schema=REPLAY_TRACE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_PROGRAM,
+        _async_start_program,
+        schema=START_PROGRAM_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_PROGRAM,
+        _async_stop_program,
+        schema=STOP_PROGRAM_SCHEMA,
+    )
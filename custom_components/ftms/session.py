@@ -0,0 +1,167 @@
+"""Workout session recorder."""
+
+import itertools
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_CAPACITY = 524288
+"""
+Maximum number of samples. About 14.5 hours at 10 Hz, so a full session of a
+fast machine is kept. Rows are allocated as the session grows: an hour at 4 Hz
+of 16 columns takes about 1 MB.
+"""
+
+
+class SessionBuffer:
+    """
+    Struct-of-arrays ring buffer of the training data samples of a session.
+
+    Every sample appends a row with the current values of all columns. Absent
+    values are carried forward from the previous rows, unknown ones are `NaN`.
+    Columns are created for the properties observed in the data only. Memory
+    grows with the session up to `capacity` rows, then the oldest rows are
+    overwritten. Samples are kept after the session end until the next start.
+    """
+
+    __slots__ = (
+        "_data",
+        "_head",
+        "_index",
+        "_last",
+        "_properties",
+        "_times",
+        "active",
+        "capacity",
+        "columns",
+    )
+
+    def __init__(
+        self, properties: Iterable[str], capacity: int = SESSION_CAPACITY
+    ) -> None:
+        self._properties = frozenset(properties)
+        self.capacity = capacity
+        self.columns: tuple[str, ...] = ()
+        self._index: dict[str, int] = {}
+        self._data: list[array] = []
+        self._last: list[float] = []
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._times)
+
+    @property
+    def start_time(self) -> float | None:
+        """UNIX timestamp of the oldest sample."""
+        return self._times[self._head % len(self)] if len(self) else None
+
+    @property
+    def end_time(self) -> float | None:
+        """UNIX timestamp of the newest sample."""
+        return self._times[self._head - 1] if len(self) else None
+
+    def copy(self) -> "SessionBuffer":
+        """Independent copy. Arrays are copied as plain memory blocks."""
+
+        result = SessionBuffer(self._properties, self.capacity)
+        result.columns, result._index = self.columns, self._index.copy()
+        result._times = self._times[:]
+        result._data = [x[:] for x in self._data]
+        result._last = self._last.copy()
+        result._head, result.active = self._head, self.active
+
+        return result
+
+    def last(self, column: str) -> float:
+        """Last known value of the column. `NaN` if unknown."""
+        return self._last[self._index[column]] if column in self._index else math.nan
+
+    def clear(self) -> None:
+        """Drop the samples and the last values."""
+
+        self._last = [math.nan] * len(self.columns)
+        self._drop()
+        self.active = False
+
+    def start(self) -> None:
+        """Start new session. Samples of the previous one are dropped."""
+
+        _LOGGER.debug("Session is started. Dropping %d samples.", len(self))
+
+        self._drop()
+        self.active = True
+
+    def finish(self) -> None:
+        """Finish the session. Samples are kept for export."""
+
+        _LOGGER.debug("Session of %d samples is finished.", len(self))
+
+        self.active = False
+
+    def _drop(self) -> None:
+        self._times = array("d")
+        self._data = [array("f") for _ in self.columns]
+        self._head = 0
+
+    def _add_column(self, key: str) -> int:
+        """Column of the newly observed property. Unknown in the previous rows."""
+
+        self._index[key] = i = len(self.columns)
+        self.columns += (key,)
+        self._data.append(array("f", [math.nan]) * len(self._times))
+        self._last.append(math.nan)
+
+        return i
+
+    def update(self, data: Mapping[str, Any]) -> None:
+        """Update the last values without a sample."""
+
+        last, index, properties = self._last, self._index, self._properties
+
+        for k, v in data.items():
+            if v is None or ((i := index.get(k)) is None and k not in properties):
+                continue
+
+            try:
+                x = float(v)
+
+            except (TypeError, ValueError):
+                continue
+
+            last[i if i is not None else self._add_column(k)] = x
+
+    def append(self, timestamp: float, data: Mapping[str, Any]) -> None:
+        """Update the last values and append the sample."""
+
+        self.update(data)
+
+        if (head := self._head) == len(self._times) < self.capacity:
+            self._times.append(timestamp)
+
+            for column, value in zip(self._data, self._last):
+                column.append(value)
+
+        else:
+            self._times[head] = timestamp
+
+            for column, value in zip(self._data, self._last):
+                column[head] = value
+
+        self._head = (head + 1) % self.capacity
+
+    def rows(self, columns: Iterable[str]) -> Iterator[tuple[float, ...]]:
+        """Chronological rows of a timestamp and the values of requested columns."""
+
+        arrays = [self._times, *(self._data[self._index[k]] for k in columns)]
+
+        if len(self) < self.capacity or not (head := self._head):
+            return zip(*arrays)
+
+        return itertools.chain(
+            zip(*(itertools.islice(x, head, None) for x in arrays)),
+            zip(*(itertools.islice(x, head) for x in arrays)),
+        )
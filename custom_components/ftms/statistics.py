@@ -0,0 +1,277 @@
+"""Long-term statistics of the training data imported by the integration."""
+
+import datetime as dt
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from pyftms import FitnessMachine, FtmsEvents
+from pyftms.client import const as c
+
+from .const import DOMAIN
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+
+except ImportError:  # Home Assistant before 2025.4
+    StatisticMeanType = None
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_TOTALS = (c.DISTANCE_TOTAL, c.ENERGY_TOTAL, c.STEP_COUNT, c.STROKE_COUNT)
+"""Counters imported as sums. Other properties are imported as mean, min and max."""
+
+_HOUR = 3600
+_IMPORT_INTERVAL = dt.timedelta(minutes=1)
+"""Interval of the current hour statistics upsert."""
+_MAX_GAP = 5.0
+"""Longer gaps between samples are not accounted in the mean, seconds."""
+
+
+class _Mean:
+    """
+    Time-weighted mean, minimum and maximum of an hour.
+
+    Value is held until the next sample. Hold at the end of the hour is carried
+    over to the next one.
+    """
+
+    __slots__ = ("_duration", "_sum", "_time", "_value", "changed", "max", "min")
+
+    def __init__(self) -> None:
+        self._time: float | None = None
+        self._value = 0.0
+        self._clear()
+
+    def _clear(self) -> None:
+        self._duration = self._sum = 0.0
+        self.changed = False
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def _hold(self, timestamp: float) -> bool:
+        """Account the held value till the time. `False` if it was not held."""
+
+        if self._time is None or not 0 <= (d := timestamp - self._time) <= _MAX_GAP:
+            return False
+
+        self._duration += d
+        self._sum += self._value * d
+
+        return True
+
+    def add(self, timestamp: float, value: float) -> None:
+        self._hold(timestamp)
+        self._time, self._value, self.changed = timestamp, value, True
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def roll(self, start: dt.datetime, end: float, carry: bool) -> StatisticData | None:
+        """Finish the hour. Returns its final row if changed."""
+
+        if held := self._hold(end):
+            self.changed = True
+
+        row = self.row(start) if self.changed else None
+        self._clear()
+
+        if carry and held:
+            self._time, self.min, self.max = end, self._value, self._value
+
+        else:
+            self._time = None
+
+        return row
+
+    def row(self, start: dt.datetime) -> StatisticData | None:
+        if self.min is None:
+            return None
+
+        mean = self._sum / self._duration if self._duration else self._value
+
+        return StatisticData(start=start, mean=mean, min=self.min, max=self.max)
+
+
+class _Sum:
+    """
+    Growing sum of a counter. Counter reset by the machine is a new workout.
+
+    Base is the sum of the last imported statistics. Until it is loaded, the
+    statistics are not imported.
+    """
+
+    __slots__ = ("_last", "_sum", "base", "changed")
+
+    def __init__(self) -> None:
+        self._last: float | None = None
+        self._sum = 0.0
+        self.changed = False
+        self.base: float | None = None
+
+    def add(self, timestamp: float, value: float) -> None:
+        if self._last is not None and value != self._last:
+            self._sum += value - self._last if value > self._last else value
+            self.changed = True
+
+        self._last = value
+
+    def roll(self, start: dt.datetime, end: float, carry: bool) -> StatisticData | None:
+        """Finish the hour. Returns its final row if changed."""
+
+        row = self.row(start) if self.changed else None
+        self.changed = False
+
+        return row
+
+    def row(self, start: dt.datetime) -> StatisticData | None:
+        if self.base is None or self._last is None:
+            return None
+
+        return StatisticData(start=start, state=self._last, sum=self.base + self._sum)
+
+
+class StatisticsImporter:
+    """
+    Imports hourly statistics of the training data as external statistics.
+
+    Long-term statistics have hourly rows, so the row of the current hour is
+    upserted every minute if it has new samples, and finalized when the hour
+    is over. Statistics ids are `ftms:<unique_id>_<key>`.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        ftms: FitnessMachine,
+        unique_id: str,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._ftms = ftms
+        self._unique_id = unique_id
+        self._stats: dict[str, _Mean | _Sum] = {}
+        self._values: dict[str, float] = {}
+        """Last values of the properties. Updates carry only the changed ones."""
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._hour = int(time.time()) // _HOUR
+        self._unsub: CALLBACK_TYPE | None = None
+
+    def statistic_id(self, key: str) -> str:
+        return f"{DOMAIN}:{self._unique_id}_{key}"
+
+    @callback
+    def async_register(self, key: str, unit: str | None) -> None:
+        """Import statistics of the property."""
+
+        total = key in STATISTICS_TOTALS
+        metadata = StatisticMetaData(
+            has_sum=total,
+            name=f"{self._ftms.name} {key.replace('_', ' ')}",
+            source=DOMAIN,
+            statistic_id=self.statistic_id(key),
+            unit_of_measurement=unit,
+        )
+
+        if StatisticMeanType is None:
+            metadata["has_mean"] = not total
+
+        else:
+            conv = STATISTIC_UNIT_TO_UNIT_CONVERTER.get(unit)
+            metadata["unit_class"] = conv.UNIT_CLASS if conv else None
+            metadata["mean_type"] = (
+                StatisticMeanType.NONE if total else StatisticMeanType.ARITHMETIC
+            )
+
+        self._metadata[key] = metadata
+        self._stats[key] = stat = _Sum() if total else _Mean()
+
+        if isinstance(stat, _Sum):
+            self._entry.async_create_background_task(
+                self._hass,
+                self._async_load_base(key, stat),
+                f"ftms statistics base {self.statistic_id(key)}",
+            )
+
+    async def _async_load_base(self, key: str, stat: _Sum) -> None:
+        """Continue the sum of the last imported statistics."""
+
+        statistic_id = self.statistic_id(key)
+        last = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics, self._hass, 1, statistic_id, True, {"sum"}
+        )
+
+        stat.base = (x[0].get("sum") or 0) if (x := last.get(statistic_id)) else 0
+
+    @callback
+    def async_start(self) -> None:
+        self._unsub = async_track_time_interval(
+            self._hass, self._async_on_timer, _IMPORT_INTERVAL
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+
+        self._async_on_timer()
+
+    @callback
+    def async_on_event(self, e: FtmsEvents) -> None:
+        """Coordinator events listener."""
+
+        # Advertisements update RSSI while disconnected too.
+        if e.event_id != "update" or not self._ftms.is_connected:
+            return
+
+        self._async_roll(now := time.time())
+
+        data, values = e.event_data, self._values
+
+        for key, stat in self._stats.items():
+            if (x := data.get(key)) is not None:
+                values[key] = x
+
+            if (x := values.get(key)) is not None:
+                stat.add(now, x)
+
+    @callback
+    def _async_on_timer(self, *_: Any) -> None:
+        self._async_roll(time.time())
+
+        start = dt.datetime.fromtimestamp(self._hour * _HOUR, dt.UTC)
+
+        for key, stat in self._stats.items():
+            if stat.changed and (row := stat.row(start)) is not None:
+                stat.changed = False
+                self._async_import(key, row)
+
+    @callback
+    def _async_roll(self, timestamp: float) -> None:
+        """Finalize the past hour."""
+
+        if (hour := int(timestamp) // _HOUR) == self._hour:
+            return
+
+        start = dt.datetime.fromtimestamp(self._hour * _HOUR, dt.UTC)
+        end, carry = (self._hour + 1) * _HOUR, hour == self._hour + 1
+        self._hour = hour
+
+        for key, stat in self._stats.items():
+            self._async_import(key, stat.roll(start, end, carry))
+
+    @callback
+    def _async_import(self, key: str, row: StatisticData | None) -> None:
+        if row is not None:
+            async_add_external_statistics(self._hass, self._metadata[key], (row,))
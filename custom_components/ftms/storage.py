@@ -0,0 +1,109 @@
+"""Persisted capabilities of fitness machines."""
+
+import dataclasses as dc
+import logging
+from typing import Any, Self
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from pyftms import DeviceInfo, FitnessMachine, MachineType, SettingRange
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.capabilities"
+
+_SAVE_DELAY = 1.0
+
+
+@dc.dataclass(frozen=True, kw_only=True)
+class Capabilities:
+    """Static information of fitness machine. Entities are created from it."""
+
+    machine_type: MachineType
+    device_info: DeviceInfo
+    available_properties: tuple[str, ...]
+    supported_settings: tuple[str, ...]
+    supported_ranges: dict[str, SettingRange]
+
+    @classmethod
+    def from_client(cls, ftms: FitnessMachine) -> Self:
+        """Snapshot of connected client."""
+
+        return cls(
+            machine_type=ftms.machine_type,
+            device_info=ftms.device_info,
+            available_properties=tuple(ftms.available_properties),
+            supported_settings=tuple(ftms.supported_settings),
+            supported_ranges=dict(ftms.supported_ranges),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            machine_type=MachineType[data["machine_type"]],
+            device_info=data["device_info"],
+            available_properties=tuple(data["available_properties"]),
+            supported_settings=tuple(data["supported_settings"]),
+            supported_ranges={
+                k: SettingRange(*v) for k, v in data["supported_ranges"].items()
+            },
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        assert self.machine_type.name
+
+        return {
+            "machine_type": self.machine_type.name,
+            "device_info": dict(self.device_info),
+            "available_properties": list(self.available_properties),
+            "supported_settings": list(self.supported_settings),
+            "supported_ranges": {k: list(v) for k, v in self.supported_ranges.items()},
+        }
+
+
+class CapabilitiesStore:
+    """Capabilities of all configured machines. Keyed by Bluetooth address."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        self._data = await self._store.async_load() or {}
+
+    def get(self, address: str) -> Capabilities | None:
+        if (data := self._data.get(address)) is None:
+            return None
+
+        try:
+            return Capabilities.from_dict(data)
+
+        except (KeyError, TypeError, ValueError):
+            _LOGGER.warning("Stored capabilities of '%s' are corrupted.", address)
+            return None
+
+    @callback
+    def async_save(self, address: str, capabilities: Capabilities) -> None:
+        self._data[address] = capabilities.as_dict()
+        self._store.async_delay_save(lambda: self._data, _SAVE_DELAY)
+
+    @callback
+    def async_remove(self, address: str) -> None:
+        if self._data.pop(address, None) is not None:
+            self._store.async_delay_save(lambda: self._data, _SAVE_DELAY)
+
+
+@singleton(f"{DOMAIN}_capabilities_store")
+async def async_get_capabilities_store(hass: HomeAssistant) -> CapabilitiesStore:
+    """Get shared capabilities store."""
+
+    store = CapabilitiesStore(hass)
+    await store.async_load()
+
+    return store
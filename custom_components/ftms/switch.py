@@ -3,7 +3,6 @@
 import logging
 from typing import Any, override
 
-from bleak.exc import BleakError
 from homeassistant.components.switch import (
     SwitchDeviceClass,
     SwitchEntity,
@@ -56,22 +55,19 @@ class ConnectionSwitchEntity(FtmsEntity, SwitchEntity, RestoreEntity):
 
     @override
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the entity on."""
+        """Turn the entity on. Connection is made by the connection manager."""
 
-        try:
-            await self.ftms.connect()
-
-        except BleakError:
-            self.hass.config_entries.async_schedule_reload(self._data.entry_id)
-
-        finally:
-            self._attr_is_on = True
-            self.async_write_ha_state()
+        self._data.connection.async_cancel_idle()
+        self.ftms.need_connect = True
+        self._data.connection.async_reconnect()
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     @override
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
 
+        self._data.connection.async_cancel_idle()
         await self.ftms.disconnect()
         self._attr_is_on = False
         self.async_write_ha_state()
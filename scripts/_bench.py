@@ -0,0 +1,80 @@
+"""
+Stand-ins of the integration benchmarks.
+
+Benchmarks run the integration code on a bare Home Assistant core without the
+machine. Home Assistant and `pyftms` of the manifest must be installed.
+"""
+
+import contextlib
+import random
+import sys
+import tempfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pyftms
+from bleak.backends.device import BLEDevice
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+from pyftms.client import const as c
+
+RATE = 4
+"""Notifications per second of the simulated machines."""
+TRACES = Path(__file__).parent / "traces"
+"""Bundled raw traces of the replay harness."""
+
+
+@contextlib.asynccontextmanager
+async def async_hass() -> AsyncIterator[HomeAssistant]:
+    """Home Assistant core without integrations."""
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+
+        try:
+            yield hass
+
+        finally:
+            await hass.async_stop(force=True)
+
+
+def machine() -> pyftms.FitnessMachine:
+    """Treadmill client which is never connected."""
+    return pyftms.Treadmill(BLEDevice("00:00:00:00:00:00", "bench", None))
+
+
+def workout(seconds: int) -> list[pyftms.UpdateEvent]:
+    """
+    Update events of a steady treadmill run.
+
+    Like the client, every event carries only the values changed since the
+    previous notification.
+    """
+
+    rnd, prev, result = random.Random(0), {}, []
+
+    for n in range(seconds * RATE):
+        t, speed = n / RATE, 10 + rnd.choice((-0.1, 0, 0, 0.1))
+        data: dict[str, Any] = {
+            c.TRAINING_STATUS: pyftms.TrainingStatusCode.MANUAL_MODE,
+            c.SPEED_INSTANT: speed,
+            c.SPEED_AVERAGE: 10.0,
+            c.DISTANCE_TOTAL: int(t * 10 / 3.6),
+            c.INCLINATION: 1.0,
+            c.ENERGY_TOTAL: int(t / 6),
+            c.ENERGY_PER_HOUR: 600 + rnd.choice((0, 0, 0, 10)),
+            c.HEART_RATE: 140 + (n // 20) % 10,
+            c.TIME_ELAPSED: int(t),
+            c.STEP_COUNT: int(t * 2.8),
+        }
+
+        if update := {k: v for k, v in data.items() if prev.get(k) != v}:
+            result.append(pyftms.UpdateEvent(event_id="update", event_data=update))
+
+        prev = data
+
+    return result
@@ -0,0 +1,120 @@
+"""
+Benchmark of the debug channel of the coordinator events hot path.
+
+Feeds a treadmill workout to `DataCoordinator.async_handle_event` with debug
+logging disabled and enabled. Messages are formatted only inside `logging`,
+so every call of its functions is counted, except for the cached level check.
+With debug disabled, the check fails if any log record is made, the sampler is
+created, or `logging` is called beyond the level check.
+
+    python scripts/bench_debug_logging.py
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from _bench import async_hass, machine, workout
+
+from custom_components.ftms import coordinator as co
+
+_SECONDS = 600
+_LEVEL_CHECKS = ("isEnabledFor", "_is_disabled")
+"""Cached level check of the logger."""
+
+
+def _logging_calls(handler: Callable[[Any], None], events: Iterable[Any]) -> Counter:
+    """Functions of the `logging` module called by the handler."""
+
+    calls: Counter[str] = Counter()
+
+    def profile(frame, event, arg) -> None:
+        if event == "call" and frame.f_code.co_filename == logging.__file__:
+            calls[frame.f_code.co_name] += 1
+
+    sys.setprofile(profile)
+
+    try:
+        for e in events:
+            handler(e)
+
+    finally:
+        sys.setprofile(None)
+
+    for k in _LEVEL_CHECKS:
+        calls.pop(k, None)
+
+    return calls
+
+
+async def _async_run(debug: bool) -> dict[str, Any]:
+    logger = logging.getLogger(co.__name__)
+    logger.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    records = 0
+    factory = logging.getLogRecordFactory()
+
+    def counting_factory(*args, **kwargs) -> logging.LogRecord:
+        nonlocal records
+        records += 1
+        return factory(*args, **kwargs)
+
+    events = workout(_SECONDS)
+
+    async with async_hass() as hass:
+        coordinator = co.DataCoordinator(hass, machine())
+        handler = coordinator.async_handle_event
+
+        start = time.perf_counter()
+
+        for e in events:
+            handler(e)
+
+        elapsed = time.perf_counter() - start
+
+        logging.setLogRecordFactory(counting_factory)
+
+        try:
+            calls = _logging_calls(handler, events)
+
+        finally:
+            logging.setLogRecordFactory(factory)
+
+    return {
+        "events": len(events),
+        "log_records": records,
+        "logging_calls": calls.total(),
+        "sampler": coordinator._debug is not None,
+        "us_per_event": round(elapsed / len(events) * 1e6, 1),
+    }
+
+
+async def _async_main() -> int:
+    # Records of the enabled run are counted, not printed.
+    logging.getLogger(co.__name__).addHandler(logging.NullHandler())
+    logging.getLogger(co.__name__).propagate = False
+
+    # First run warms up the interpreter and library caches.
+    await _async_run(debug=False)
+    disabled = await _async_run(debug=False)
+    enabled = await _async_run(debug=True)
+
+    print(f"{'':16}{'disabled':>12}{'enabled':>12}")
+
+    for k in disabled:
+        print(f"{k:16}{disabled[k]!s:>12}{enabled[k]!s:>12}")
+
+    if disabled["log_records"] or disabled["logging_calls"] or disabled["sampler"]:
+        print("FAIL: disabled debug channel does work per event.")
+        return 1
+
+    print("OK: disabled debug channel makes no log records and formats nothing.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_async_main()))
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark of the coordinator event dispatch.
+
+Feeds a treadmill workout to the coordinator with an entity listener for
+every property of the machine. Broadcast wakes every entity on every event,
+and each one looks its key up in the event data, as before the key index.
+Key-indexed dispatch calls only the listeners of the changed keys.
+
+    python scripts/bench_dispatch.py
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+from _bench import async_hass, machine, workout
+
+from custom_components.ftms.coordinator import DataCoordinator
+
+_SECONDS = 600
+
+
+async def _async_run(indexed: bool) -> dict[str, Any]:
+    events = workout(_SECONDS)
+    callbacks = updates = 0
+
+    async with async_hass() as hass:
+        ftms = machine()
+        coordinator = DataCoordinator(hass, ftms)
+
+        for key in ftms.available_properties:
+            if indexed:
+
+                def on_value(value: Any) -> None:
+                    nonlocal callbacks, updates
+                    callbacks += 1
+                    updates += 1
+
+                coordinator.async_add_key_listener(key, on_value)
+                continue
+
+            def on_event(key: str = key) -> None:
+                nonlocal callbacks, updates
+                callbacks += 1
+
+                if coordinator.data.event_data.get(key) is not None:
+                    updates += 1
+
+            coordinator.async_add_listener(on_event)
+
+        handler = (
+            coordinator.async_handle_event
+            if indexed
+            else coordinator.async_set_updated_data
+        )
+
+        start = time.perf_counter()
+
+        for e in events:
+            handler(e)
+
+        elapsed = time.perf_counter() - start
+
+    return {
+        "events": len(events),
+        "entities": len(ftms.available_properties),
+        "callbacks": callbacks,
+        "callbacks_per_event": round(callbacks / len(events), 2),
+        "useful_callbacks": updates,
+        "us_per_event": round(elapsed / len(events) * 1e6, 1),
+    }
+
+
+async def _async_main() -> int:
+    # First run warms up the interpreter and library caches.
+    await _async_run(indexed=True)
+    broadcast = await _async_run(indexed=False)
+    indexed = await _async_run(indexed=True)
+
+    print(f"{'':22}{'broadcast':>12}{'indexed':>12}")
+
+    for k in broadcast:
+        print(f"{k:22}{broadcast[k]!s:>12}{indexed[k]!s:>12}")
+
+    if indexed["callbacks"] != broadcast["useful_callbacks"]:
+        print("FAIL: indexed dispatch calls other listeners than the changed keys.")
+        return 1
+
+    print("OK: only the listeners of the changed keys are called.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_async_main()))
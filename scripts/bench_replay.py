@@ -0,0 +1,241 @@
+"""
+Replay harness of the integration with stand-in fitness machines.
+
+Sets up a config entry of every bundled trace through `async_setup_entry`,
+with the client of `pyftms` replaced by a stand-in which connects without
+Bluetooth. Raw notifications of the trace are then parsed by the client and
+handled as the live workout: coordinator, entities, session, summary and
+derived metrics. Reports sustained events and state writes per second, CPU
+time per event and peak memory.
+
+    python scripts/bench_replay.py [--speed N] [--memory] [TRACE ...]
+
+Zero speed replays as fast as possible, otherwise the recorded timing is kept
+and accelerated `N` times. Traces are made by `make_traces.py`.
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import patch
+
+import pyftms
+from _bench import TRACES, async_hass
+from bleak.backends.device import BLEDevice
+from homeassistant import config_entries, loader
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_ADDRESS, CONF_SENSORS
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry,
+    category_registry,
+    device_registry,
+    entity_registry,
+    floor_registry,
+    label_registry,
+)
+from homeassistant.setup import async_setup_component
+from pyftms.client.properties.features import MachineFeatures, MachineSettings
+
+from custom_components.ftms.const import CONF_DERIVED_SENSORS, DOMAIN
+from custom_components.ftms.replay import (
+    RAW_TRACE_SUFFIX,
+    async_replay,
+    load_trace,
+    raw_trace_feed,
+)
+from custom_components.ftms.storage import (
+    Capabilities,
+    async_get_capabilities_store,
+)
+
+_MACHINES: dict[str, tuple[type[pyftms.FitnessMachine], MachineSettings]] = {
+    "treadmill": (pyftms.Treadmill, MachineSettings.SPEED | MachineSettings.INCLINE),
+    "indoor_bike": (
+        pyftms.IndoorBike,
+        MachineSettings.RESISTANCE | MachineSettings.POWER,
+    ),
+    "rower": (pyftms.Rower, MachineSettings.RESISTANCE | MachineSettings.POWER),
+    "cross_trainer": (
+        pyftms.CrossTrainer,
+        MachineSettings.RESISTANCE | MachineSettings.POWER,
+    ),
+}
+"""Clients and target settings of the machines of the bundled traces."""
+
+_RANGES = {
+    "target_speed": pyftms.SettingRange(0.5, 20, 0.1),
+    "target_inclination": pyftms.SettingRange(0, 15, 0.5),
+    "target_resistance": pyftms.SettingRange(1, 20, 1),
+    "target_power": pyftms.SettingRange(25, 1000, 5),
+}
+
+
+class _Link:
+    """Stand-in of the connected `BleakClient`."""
+
+    def __init__(self, ftms: pyftms.FitnessMachine) -> None:
+        self._ftms = ftms
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+        self._ftms._on_disconnect(self)
+
+
+def _stand_in(
+    cls: type[pyftms.FitnessMachine], settings: MachineSettings
+) -> type[pyftms.FitnessMachine]:
+    """Client of the machine type which connects without Bluetooth."""
+
+    class StandIn(cls):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+
+            self._device_info = pyftms.DeviceInfo(
+                manufacturer="Bench", model=cls.__name__, serial_number=cls.__name__
+            )
+            self._m_features = ~MachineFeatures(0)
+            self._m_settings = settings
+            self._settings_ranges = MappingProxyType(
+                {k: v for k, v in _RANGES.items() if k in self.supported_settings}
+            )
+
+        async def _connect(self) -> None:
+            if self._need_connect and not self.is_connected:
+                self._cli = _Link(self)
+
+    return StandIn
+
+
+async def _async_setup_core(hass: HomeAssistant) -> None:
+    """Registries, config entries and Bluetooth without adapters."""
+
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+
+    for registry in (
+        area_registry,
+        category_registry,
+        floor_registry,
+        label_registry,
+        device_registry,
+        entity_registry,
+    ):
+        await registry.async_load(hass)
+
+    # Web server is not needed. USB discovery only registers its websocket API.
+    hass.config.components.update(("http", "websocket_api"))
+
+    if not await async_setup_component(hass, "bluetooth", {}):
+        raise RuntimeError("Bluetooth setup failed")
+
+
+async def _async_run(
+    name: str, path: Path, speed: float, trace_memory: bool
+) -> dict[str, Any]:
+    cls, settings = _MACHINES[name]
+    stand_in = _stand_in(cls, settings)
+    address = f"00:00:00:00:00:{list(_MACHINES).index(name):02X}"
+
+    async with async_hass() as hass:
+        await _async_setup_core(hass)
+
+        # Entities are created from stored capabilities, as for a sleeping machine.
+        caps = Capabilities.from_client(stand_in(BLEDevice(address, name, None)))
+        store = await async_get_capabilities_store(hass)
+        store.async_save(address, caps)
+
+        def get_client(ble_device, adv_or_type, **kwargs) -> pyftms.FitnessMachine:
+            return stand_in(ble_device, **kwargs)
+
+        entry = ConfigEntry(
+            data={CONF_ADDRESS: address},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options={
+                CONF_SENSORS: list(caps.available_properties),
+                CONF_DERIVED_SENSORS: True,
+            },
+            source=config_entries.SOURCE_USER,
+            subentries_data=None,
+            title=name,
+            unique_id=address,
+            version=1,
+        )
+
+        with patch.object(pyftms, "get_client", get_client):
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done(wait_background_tasks=True)
+
+        if entry.state is not ConfigEntryState.LOADED:
+            raise RuntimeError(f"Entry of '{name}' is not loaded: {entry.state}")
+
+        data = entry.runtime_data
+
+        if not data.ftms.is_connected:
+            raise RuntimeError(f"Stand-in of '{name}' is not connected")
+
+        raw, records = await hass.async_add_executor_job(load_trace, path)
+
+        if not raw:
+            raise ValueError(f"'{path.name}' is not a raw trace")
+
+        result = await async_replay(
+            data.coordinator,
+            records,
+            raw_trace_feed(data.ftms),
+            speed,
+            trace_memory,
+            live=True,
+        )
+
+        result["entities"] = len(
+            entity_registry.async_entries_for_config_entry(
+                entity_registry.async_get(hass), entry.entry_id
+            )
+        )
+        result["session_rows"] = len(data.session)
+
+        await hass.config_entries.async_unload(entry.entry_id)
+
+    return result
+
+
+async def _async_main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--speed", type=float, default=0)
+    parser.add_argument("--memory", action="store_true", help="trace peak memory")
+    parser.add_argument("traces", nargs="*", choices=list(_MACHINES))
+    args = parser.parse_args()
+
+    # Hides the warnings of the untested custom integration and deprecated helpers.
+    logging.basicConfig(level=logging.ERROR)
+
+    results = {}
+
+    for name in args.traces or _MACHINES:
+        path = TRACES / f"{name}{RAW_TRACE_SUFFIX}"
+        results[name] = await _async_run(name, path, args.speed, args.memory)
+
+    print(f"{'':20}" + "".join(f"{x:>15}" for x in results))
+
+    for k in next(iter(results.values())):
+        print(f"{k:20}" + "".join(f"{x[k]!s:>15}" for x in results.values()))
+
+    if any(not x["session_rows"] for x in results.values()):
+        print("FAIL: replayed workout did not reach the session.")
+        return 1
+
+    print("OK: traces are replayed through the entries of the stand-in machines.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_async_main()))
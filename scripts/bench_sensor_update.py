@@ -0,0 +1,135 @@
+"""
+Benchmark of the sensor entities update path.
+
+Feeds update events of all `_ENTITIES` properties to a sensor of every one of
+them through the coordinator. Enum values cycle through their members, so the
+option string is written on every event. The lookup converter is compared with
+the conversion made per update before it. The check fails if the lookup makes
+new option strings instead of reusing the precomputed ones.
+
+    python scripts/bench_sensor_update.py
+"""
+
+import asyncio
+import dataclasses as dc
+import itertools
+import sys
+import time
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any
+
+import pyftms
+from _bench import async_hass, machine
+
+from custom_components.ftms import sensor
+from custom_components.ftms.coordinator import DataCoordinator
+
+_EVENTS = 2400
+
+
+def _legacy_converter(value: Any) -> Any:
+    """Conversion made per update before the lookup."""
+    return value.name.lower() if isinstance(value, Enum) else value
+
+
+def _events() -> list[pyftms.UpdateEvent]:
+    """Update events of all sensor properties. Every value is changed."""
+
+    enums = {
+        key: itertools.cycle(desc.option_map)
+        for key, desc in sensor._ENTITIES.items()
+        if desc.option_map is not None
+    }
+
+    return [
+        pyftms.UpdateEvent(
+            event_id="update",
+            event_data={
+                k: next(enums[k]) if k in enums else float(n) for k in sensor._ENTITIES
+            },
+        )
+        for n in range(1, _EVENTS + 1)
+    ]
+
+
+async def _async_run(legacy: bool) -> dict[str, Any]:
+    events, written = _events(), []
+
+    async with async_hass() as hass:
+        ftms = machine()
+        coordinator = DataCoordinator(hass, ftms)
+        data = SimpleNamespace(
+            unique_id="bench",
+            device_info=None,
+            coordinator=coordinator,
+            ftms=ftms,
+            max_update_rate=0,
+        )
+        entry = SimpleNamespace(runtime_data=data)
+
+        for desc in sensor._ENTITIES.values():
+            if legacy and desc.option_map is not None:
+                desc = dc.replace(desc, converter=_legacy_converter, option_map=None)
+
+            entity = sensor.FtmsSensorEntity(entry, desc)
+            entity.hass, entity.entity_id = hass, f"sensor.bench_{desc.key}"
+
+            # State machine needs a loaded platform. Written values are kept,
+            # so identity of the option strings is not reused by the allocator.
+            def write(entity: sensor.FtmsSensorEntity = entity) -> None:
+                if sensor._ENTITIES[entity.key].option_map is not None:
+                    written.append(entity.native_value)
+
+            entity.async_write_ha_state = write
+            coordinator.async_add_key_listener(
+                entity.key, entity._handle_coordinator_update
+            )
+
+        handler = coordinator.async_handle_event
+
+        start = time.perf_counter()
+
+        for e in events:
+            handler(e)
+
+        elapsed = time.perf_counter() - start
+
+    updates = len(events) * len(sensor._ENTITIES)
+
+    return {
+        "entities": len(sensor._ENTITIES),
+        "updates": updates,
+        "enum_writes": len(written),
+        "enum_strings": len({id(x) for x in written}),
+        "us_per_update": round(elapsed / updates * 1e6, 2),
+    }
+
+
+async def _async_main() -> int:
+    # First run warms up the interpreter and library caches.
+    await _async_run(legacy=False)
+    legacy = await _async_run(legacy=True)
+    lookup = await _async_run(legacy=False)
+
+    print(f"{'':16}{'per update':>12}{'lookup':>12}")
+
+    for k in legacy:
+        print(f"{k:16}{legacy[k]!s:>12}{lookup[k]!s:>12}")
+
+    members = sum(
+        len(desc.option_map)
+        for desc in sensor._ENTITIES.values()
+        if desc.option_map is not None
+    )
+
+    if lookup["enum_strings"] > members:
+        print("FAIL: enum sensors make new option strings per update.")
+        return 1
+
+    print("OK: enum sensors reuse the precomputed option strings.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_async_main()))
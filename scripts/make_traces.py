@@ -0,0 +1,167 @@
+"""
+Generator of the bundled raw traces of the replay harness.
+
+Writes an interval workout of every machine type to `scripts/traces`. The
+training data is encoded by the models of `pyftms`, so the traces are parsed
+by the client as the notifications of a real machine.
+
+    python scripts/make_traces.py
+"""
+
+import dataclasses as dc
+import io
+import math
+import random
+import sys
+from collections.abc import Callable
+from typing import Any
+
+import pyftms
+from _bench import RATE, TRACES
+
+from custom_components.ftms.replay import RAW_TRACE_SUFFIX, write_raw_trace
+
+_SECONDS = 300
+
+type Profile = Callable[[float, float, random.Random], dict[str, float]]
+"""Training data values by time, intensity and random source."""
+
+
+def _pack(fmt: str, value: float) -> bytes:
+    """Encode the number of `pyftms` format, e.g. `u2.01` or `s2`."""
+
+    size, factor = int(fmt[1]), float(fmt[2:] or 1)
+    return round(value / factor).to_bytes(size, "little", signed=fmt[0] == "s")
+
+
+def encode(model: type[Any], values: dict[str, float]) -> bytes:
+    """
+    Encode the training data notification of the `pyftms` model.
+
+    Fields are present if all their values are given. The first one is present
+    when the bit 0 of the flags is cleared ("More Data" bit).
+    """
+
+    flags, buf = 1, io.BytesIO()
+
+    for n, (field, _) in enumerate(model._iter_fields_serializers()):
+        parts = [(field.name, field.metadata.get("format"))]
+
+        if not parts[0][1]:
+            tp = next(x for x in field.type.__args__ if x is not type(None))
+            parts = [(x.name, x.metadata["format"]) for x in dc.fields(tp)]
+
+        if all(k in values for k, _ in parts):
+            flags ^= 1 << n
+            buf.writelines(_pack(fmt, values[k]) for k, fmt in parts)
+
+    return flags.to_bytes(2, "little") + buf.getvalue()
+
+
+def _intensity(t: float) -> float:
+    """Warm-up ramp, then intervals of one minute hard and one minute easy."""
+
+    if t < 60:
+        return 0.5 + 0.3 * t / 60
+
+    return 1.1 if int(t - 60) // 60 % 2 == 0 else 0.7
+
+
+def _common(t: float, x: float) -> dict[str, float]:
+    return {
+        "energy_total": int(t * x / 6),
+        "energy_per_hour": round(600 * x, -1),
+        "energy_per_minute": round(10 * x),
+        "heart_rate": round(100 + 60 * x + 20 * math.tanh(t / 600)),
+        "time_elapsed": int(t),
+    }
+
+
+def _treadmill(t: float, x: float, rnd: random.Random) -> dict[str, float]:
+    speed = round(10 * x + rnd.choice((-0.1, 0, 0, 0.1)), 1)
+    return {
+        "speed_instant": speed,
+        "speed_average": round(9 + x, 1),
+        "distance_total": int(t * 9 / 3.6),
+        "inclination": 2.0 if x > 1 else 1.0,
+        "ramp_angle": 1.1 if x > 1 else 0.6,
+        "elevation_gain_positive": int(t / 30),
+        "elevation_gain_negative": 0,
+        "step_count": int(t * 2.6 * x),
+    }
+
+
+def _indoor_bike(t: float, x: float, rnd: random.Random) -> dict[str, float]:
+    power = round(200 * x) + rnd.randint(-8, 8)
+    return {
+        "speed_instant": round(30 * x + rnd.choice((-0.2, 0, 0.2)), 2),
+        "speed_average": round(27 + x, 2),
+        "cadence_instant": round(85 * x + rnd.choice((-1, 0, 0, 1))),
+        "cadence_average": 82.5,
+        "distance_total": int(t * 27 / 3.6),
+        "resistance_level": 8 if x > 1 else 4,
+        "power_instant": power,
+        "power_average": round(170 + 20 * x),
+    }
+
+
+def _rower(t: float, x: float, rnd: random.Random) -> dict[str, float]:
+    return {
+        "stroke_rate_instant": round(24 * x * 2) / 2,
+        "stroke_count": int(t * 0.4 * x),
+        "stroke_rate_average": 22.5,
+        "distance_total": int(t * 4 * x),
+        "split_time_instant": round(120 / x) + rnd.randint(-2, 2),
+        "split_time_average": 125,
+        "power_instant": round(180 * x) + rnd.randint(-10, 10),
+        "power_average": round(150 + 20 * x),
+        "resistance_level": 6,
+    }
+
+
+def _cross_trainer(t: float, x: float, rnd: random.Random) -> dict[str, float]:
+    return {
+        "speed_instant": round(12 * x + rnd.choice((-0.1, 0, 0.1)), 2),
+        "speed_average": round(11 + x, 2),
+        "distance_total": int(t * 11 / 3.6),
+        "step_rate_instant": round(130 * x) + rnd.randint(-2, 2),
+        "step_rate_average": 120,
+        "stride_count": int(t * 1.1 * x),
+        "elevation_gain_positive": int(t / 60),
+        "elevation_gain_negative": 0,
+        "inclination": 5.0 if x > 1 else 2.5,
+        "ramp_angle": 2.9 if x > 1 else 1.4,
+        "resistance_level": 10.0 if x > 1 else 6.0,
+        "power_instant": round(160 * x) + rnd.randint(-6, 6),
+        "power_average": round(130 + 20 * x),
+    }
+
+
+PROFILES: dict[str, tuple[type[pyftms.FitnessMachine], Profile]] = {
+    "treadmill": (pyftms.Treadmill, _treadmill),
+    "indoor_bike": (pyftms.IndoorBike, _indoor_bike),
+    "rower": (pyftms.Rower, _rower),
+    "cross_trainer": (pyftms.CrossTrainer, _cross_trainer),
+}
+"""Trace names, clients and workouts of the machine types."""
+
+
+def main() -> int:
+    for name, (cls, profile) in PROFILES.items():
+        rnd, records = random.Random(0), []
+
+        for n in range(_SECONDS * RATE):
+            t = n / RATE
+            x = _intensity(t)
+            values = profile(t, x, rnd) | _common(t, x)
+            records.append((t, encode(cls._data_model, values)))
+
+        path = TRACES / f"{name}{RAW_TRACE_SUFFIX}"
+        write_raw_trace(path, records)
+        print(f"{path.name}: {len(records)} records, {path.stat().st_size} bytes")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())